@@ -4,21 +4,70 @@ Rate limiting utilities for authentication endpoints.
 Provides decorators and utilities to prevent brute-force attacks and spam.
 """
 
-from functools import wraps
+from functools import lru_cache, wraps
 from django.core.cache import cache
 from django.conf import settings
 from rest_framework.response import Response
+from rest_framework.throttling import BaseThrottle
 from rest_framework import status
 from typing import Callable, Optional
 import hashlib
+import logging
+import secrets
 import time
 
+logger = logging.getLogger(__name__)
+
+
+# Sliding-window rate limit as a single atomic Lua script (one round-trip):
+# drop entries older than the window, count what's left, and either record
+# the new hit or return the oldest entry's timestamp so the caller can
+# compute retry_after. Avoids the fixed-window burst-at-boundary problem.
+_SLIDING_LUA = (
+    "redis.call('ZREMRANGEBYSCORE',KEYS[1],0,ARGV[1]-ARGV[2]*1000) "
+    "local n=redis.call('ZCARD',KEYS[1]) "
+    "if n<tonumber(ARGV[3]) then "
+    "redis.call('ZADD',KEYS[1],ARGV[1],ARGV[1]..':'..ARGV[4]) "
+    "redis.call('PEXPIRE',KEYS[1],ARGV[2]*1000) "
+    "return {0,n+1} "
+    "else "
+    "return {1,redis.call('ZRANGE',KEYS[1],0,0,'WITHSCORES')[2]} "
+    "end"
+)
+
+# Check-only variant: trim the window and count without recording a hit,
+# so increment=False reads the same ZSET the incrementing path writes.
+_COUNT_LUA = (
+    "redis.call('ZREMRANGEBYSCORE',KEYS[1],0,ARGV[1]-ARGV[2]*1000) "
+    "local n=redis.call('ZCARD',KEYS[1]) "
+    "if n<tonumber(ARGV[3]) then "
+    "return {0,n} "
+    "else "
+    "return {1,redis.call('ZRANGE',KEYS[1],0,0,'WITHSCORES')[2]} "
+    "end"
+)
+
 
 class RateLimitExceeded(Exception):
     """Exception raised when rate limit is exceeded."""
     pass
 
 
+_PERIOD_MAP = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+@lru_cache(maxsize=None)
+def _parse_rate(rate: str) -> tuple[int, int]:
+    """
+    Parse a rate string like '5/m' into (limit, period_seconds).
+
+    Memoized so the split/int work happens once per distinct rate
+    string instead of on every request.
+    """
+    limit, period_str = rate.split('/')
+    return int(limit), _PERIOD_MAP.get(period_str.lower(), 60)
+
+
 def get_client_ip(request) -> str:
     """
     Get client IP address from request.
@@ -29,12 +78,11 @@ def get_client_ip(request) -> str:
     Returns:
         str: Client IP address
     """
-    x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-    if x_forwarded_for:
-        ip = x_forwarded_for.split(',')[0].strip()
-    else:
-        ip = request.META.get('REMOTE_ADDR', '')
-    return ip
+    xff = request.META.get('HTTP_X_FORWARDED_FOR')
+    if xff:
+        # partition scans once without building the full split list
+        return xff.partition(',')[0].strip()
+    return request.META.get('REMOTE_ADDR', '')
 
 
 def get_rate_limit_key(identifier: str, action: str) -> str:
@@ -48,11 +96,22 @@ def get_rate_limit_key(identifier: str, action: str) -> str:
     Returns:
         str: Cache key
     """
-    # Hash the identifier for privacy
-    hashed = hashlib.sha256(identifier.encode()).hexdigest()[:16]
+    # Hash the identifier for privacy. BLAKE2b with a short digest is
+    # ~3x faster than SHA-256 on small inputs and the key never leaves
+    # the server, so cryptographic strength isn't needed here.
+    hashed = hashlib.blake2b(identifier.encode('utf-8', 'ignore'), digest_size=8).hexdigest()
     return f"ratelimit:{action}:{hashed}"
 
 
+def _get_redis_client():
+    """Get the raw Redis client if the cache backend is django-redis."""
+    try:
+        return cache.client.get_client(write=True)
+    except AttributeError:
+        # Non-Redis backend (e.g. LocMemCache in development)
+        return None
+
+
 def is_rate_limited(
     identifier: str,
     action: str,
@@ -75,26 +134,74 @@ def is_rate_limited(
     """
     cache_key = get_rate_limit_key(identifier, action)
 
-    # Get current count
+    client = _get_redis_client()
+    if client is not None:
+        # Sliding window over a ZSET, executed atomically in one
+        # round-trip. Unlike a fixed window, bursting 2x the limit
+        # across a window boundary is not possible. Check-only calls
+        # run the non-recording variant against the same key.
+        now_ms = int(time.time() * 1000)
+        try:
+            limited, value = client.eval(
+                _SLIDING_LUA if increment else _COUNT_LUA, 1, cache_key,
+                now_ms, period, limit, secrets.token_hex(4),
+            )
+        except Exception as exc:
+            # Honor the cache backend's fail-open contract: production
+            # sets IGNORE_EXCEPTIONS, and a Redis outage should degrade
+            # to "not limited" rather than 500 every login
+            if getattr(cache, '_ignore_exceptions', False):
+                logger.warning(f"Rate limit check failed open for '{action}': {exc}")
+                return False, None
+            raise
+
+        if limited:
+            # value is the oldest entry's timestamp (ms); it expires
+            # from the window period seconds after it was recorded.
+            oldest_ms = int(float(value))
+            retry_after = period - (now_ms - oldest_ms) // 1000
+            return True, max(retry_after, 1)
+
+        return False, None
+
+    # Fallback for non-Redis backends
+    if increment:
+        # cache.add maps to SET NX EX: exactly one concurrent first
+        # request wins and sets the TTL, the rest fall through to incr.
+        # Also saves the separate cache.get on every hit.
+        added = cache.add(cache_key, 1, period)
+        count = 1 if added else cache.incr(cache_key)
+
+        if count > limit:
+            # Get TTL to inform user when they can retry
+            ttl = cache.ttl(cache_key) if hasattr(cache, 'ttl') else None
+            return True, max(ttl, 1) if ttl else period
+
+        return False, None
+
     current_count = cache.get(cache_key, 0)
 
     if current_count >= limit:
-        # Get TTL to inform user when they can retry
-        ttl = cache.ttl(cache_key)
+        ttl = cache.ttl(cache_key) if hasattr(cache, 'ttl') else None
         return True, max(ttl, 1) if ttl else period
 
-    if increment:
-        # Increment counter
-        if current_count == 0:
-            # First request, set with expiry
-            cache.set(cache_key, 1, period)
-        else:
-            # Increment existing counter
-            cache.incr(cache_key)
-
     return False, None
 
 
+def _get_identifier(request, key, view_instance=None) -> str:
+    """Resolve the rate-limit identifier for a request ('ip'/'user'/'email')."""
+    if key == 'user':
+        if request.user.is_authenticated:
+            return str(request.user.id)
+        return get_client_ip(request)
+    if key == 'email':
+        email = request.data.get('email', '')
+        return email if email else get_client_ip(request)
+    if callable(key):
+        return key(view_instance, request)
+    return get_client_ip(request)
+
+
 def ratelimit(
     key: str = 'ip',
     rate: str = '5/m',
@@ -119,42 +226,19 @@ def ratelimit(
         def forgot_password(request):
             ...
     """
+    # Parse the rate and normalize the method once at decoration time
+    limit, period = _parse_rate(rate)
+    method_upper = method.upper()
+
     def decorator(view_func: Callable):
         @wraps(view_func)
         def wrapped_view(view_instance, request, *args, **kwargs):
-            # Parse rate string
-            limit, period_str = rate.split('/')
-            limit = int(limit)
-
-            # Convert period to seconds
-            period_map = {
-                's': 1,
-                'm': 60,
-                'h': 3600,
-                'd': 86400,
-            }
-            period = period_map.get(period_str.lower(), 60)
-
-            # Check if method matches
-            if method != 'ALL' and request.method != method.upper():
+            # Method filter first: excluded requests pay nothing
+            if method_upper != 'ALL' and request.method != method_upper:
                 return view_func(view_instance, request, *args, **kwargs)
 
             # Get identifier based on key type
-            if key == 'ip':
-                identifier = get_client_ip(request)
-            elif key == 'user':
-                if request.user.is_authenticated:
-                    identifier = str(request.user.id)
-                else:
-                    identifier = get_client_ip(request)
-            elif key == 'email':
-                # Get email from request data
-                email = request.data.get('email', '')
-                identifier = email if email else get_client_ip(request)
-            elif callable(key):
-                identifier = key(view_instance, request)
-            else:
-                identifier = get_client_ip(request)
+            identifier = _get_identifier(request, key, view_instance)
 
             # Get action name (view name + method)
             action = f"{view_func.__name__}:{request.method}"
@@ -183,6 +267,47 @@ def ratelimit(
     return decorator
 
 
+class AuthRateThrottle(BaseThrottle):
+    """
+    DRF throttle backed by the sliding-window limiter.
+
+    Reads the ratelimit_* attributes off the view, so it composes with
+    RateLimitMixin configuration. Running inside DRF's initial() means
+    a single cache round-trip per request and a proper Retry-After
+    header on 429 responses.
+    """
+
+    def allow_request(self, request, view):
+        method = getattr(view, 'ratelimit_method', 'ALL')
+        if method != 'ALL' and request.method != method.upper():
+            return True
+
+        limit, period = _parse_rate(getattr(view, 'ratelimit_rate', '10/m'))
+        identifier = _get_identifier(request, getattr(view, 'ratelimit_key', 'ip'), view)
+        action = f"{view.__class__.__name__}:{request.method}"
+
+        is_limited, retry_after = is_rate_limited(
+            identifier=identifier,
+            action=action,
+            limit=limit,
+            period=period,
+            increment=True
+        )
+
+        # Add rate limit info to request
+        request.rate_limited = is_limited
+        self._retry_after = retry_after
+
+        if is_limited and not getattr(view, 'ratelimit_block', True):
+            return True
+
+        return not is_limited
+
+    def wait(self):
+        """Seconds until the client may retry (sets Retry-After)."""
+        return getattr(self, '_retry_after', None)
+
+
 class RateLimitMixin:
     """
     Mixin for class-based views to add rate limiting.
@@ -200,53 +325,9 @@ class RateLimitMixin:
     ratelimit_method: str = 'ALL'
     ratelimit_block: bool = True
 
-    def dispatch(self, request, *args, **kwargs):
-        """Override dispatch to add rate limiting."""
-        # Parse rate string
-        limit, period_str = self.ratelimit_rate.split('/')
-        limit = int(limit)
-
-        # Convert period to seconds
-        period_map = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
-        period = period_map.get(period_str.lower(), 60)
-
-        # Check if method matches
-        if self.ratelimit_method != 'ALL' and request.method != self.ratelimit_method.upper():
-            return super().dispatch(request, *args, **kwargs)
-
-        # Get identifier
-        if self.ratelimit_key == 'ip':
-            identifier = get_client_ip(request)
-        elif self.ratelimit_key == 'user':
-            identifier = str(request.user.id) if request.user.is_authenticated else get_client_ip(request)
-        elif self.ratelimit_key == 'email':
-            email = request.data.get('email', '')
-            identifier = email if email else get_client_ip(request)
-        else:
-            identifier = get_client_ip(request)
-
-        # Get action name
-        action = f"{self.__class__.__name__}:{request.method}"
-
-        # Check rate limit
-        is_limited, retry_after = is_rate_limited(
-            identifier=identifier,
-            action=action,
-            limit=limit,
-            period=period,
-            increment=True
-        )
-
-        if is_limited and self.ratelimit_block:
-            return Response({
-                'error': 'Rate limit exceeded. Please try again later.',
-                'retry_after': retry_after
-            }, status=status.HTTP_429_TOO_MANY_REQUESTS)
-
-        # Add rate limit info to request
-        request.rate_limited = is_limited
-
-        return super().dispatch(request, *args, **kwargs)
+    def get_throttles(self):
+        """Rate limiting runs once through DRF's throttle pipeline."""
+        return [AuthRateThrottle()]
 
 
 # Predefined rate limit configurations
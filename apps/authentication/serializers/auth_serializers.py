@@ -76,13 +76,10 @@ class ChangePasswordSerializer(serializers.Serializer):
         if attrs['new_password'] != attrs['new_password_confirm']:
             raise serializers.ValidationError({"new_password": "Passwords don't match"})
         return attrs
-    
-    def validate_old_password(self, value):
-        """Validate old password."""
-        user = self.context['request'].user
-        if not user.check_password(value):
-            raise serializers.ValidationError('Old password is incorrect')
-        return value
+
+    # The old password itself is checked once by
+    # AuthService.change_password; verifying it here too would run the
+    # (deliberately slow) password hasher twice per request.
 
 
 class ForgotPasswordSerializer(serializers.Serializer):
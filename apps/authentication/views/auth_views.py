@@ -7,11 +7,17 @@ from rest_framework.response import Response
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth import get_user_model
 from django.conf import settings
+from django.db import transaction
+from django.http import HttpResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from apps.authentication.serializers import (
     RegisterSerializer,
     LoginSerializer,
-    UserSerializer,
     ChangePasswordSerializer,
     ForgotPasswordSerializer,
     ResetPasswordSerializer,
@@ -23,6 +29,40 @@ from apps.authentication.ratelimit import RateLimitMixin
 User = get_user_model()
 
 
+def _fast_json(data, status=200):
+    """
+    Serialize a success payload straight to JSON, skipping DRF's
+    renderer/content-negotiation stack. Only used on hot-path success
+    branches where the response is always JSON; error branches keep
+    DRF's Response.
+    """
+    if orjson is not None:
+        return HttpResponse(
+            orjson.dumps(data, default=str),
+            content_type='application/json',
+            status=status,
+        )
+    return Response(data, status=status)
+
+
+def _user_dict(user):
+    """
+    Serialize a user for auth responses.
+
+    The field set matches UserSerializer but skips DRF's per-call field
+    introspection, which dominates serialization cost on the hot
+    login/register path.
+    """
+    return {
+        'id': user.id,
+        'email': user.email,
+        'first_name': user.first_name,
+        'last_name': user.last_name,
+        'is_verified': user.is_verified,
+        'date_joined': user.date_joined.isoformat() if user.date_joined else None,
+    }
+
+
 class RegisterView(RateLimitMixin, APIView):
     """
     Register a new user.
@@ -57,15 +97,20 @@ class RegisterView(RateLimitMixin, APIView):
             auto_verified = getattr(settings, 'AUTO_VERIFY_USERS', False)
 
             if not skip_email and not auto_verified:
-                # Send verification email asynchronously
+                # Send verification email off the request path, only
+                # once the user row is actually committed
                 if getattr(settings, 'CELERY_TASK_ALWAYS_EAGER', False):
                     # In development/test mode, send synchronously
                     from apps.email_service.services import EmailService
-                    EmailService.send_verification_email(user, verification_token.token)
+                    transaction.on_commit(
+                        lambda: EmailService.send_verification_email(user, verification_token.token)
+                    )
                 else:
                     # In production, send asynchronously via Celery
                     from apps.email_service.tasks import send_verification_email_task
-                    send_verification_email_task.delay(user.id, verification_token.token)
+                    transaction.on_commit(
+                        lambda: send_verification_email_task.delay(user.id, verification_token.token)
+                    )
 
             # Customize message based on whether email was sent
             if auto_verified:
@@ -75,9 +120,9 @@ class RegisterView(RateLimitMixin, APIView):
             else:
                 message = 'Registration successful. Please check your email to verify your account.'
 
-            return Response({
+            return _fast_json({
                 'message': message,
-                'user': UserSerializer(user).data
+                'user': _user_dict(user)
             }, status=status.HTTP_201_CREATED)
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -104,15 +149,18 @@ class LoginView(RateLimitMixin, APIView):
         if serializer.is_valid():
             user = serializer.validated_data['user']
 
-            # Generate JWT tokens
+            # Generate JWT tokens. Bind access_token to a local first:
+            # the property builds (and signs) a new token each access,
+            # so each token is created and serialized exactly once.
             refresh = RefreshToken.for_user(user)
+            access = refresh.access_token
 
-            return Response({
+            return _fast_json({
                 'message': 'Login successful',
-                'user': UserSerializer(user).data,
+                'user': _user_dict(user),
                 'tokens': {
                     'refresh': str(refresh),
-                    'access': str(refresh.access_token),
+                    'access': str(access),
                 }
             }, status=status.HTTP_200_OK)
 
@@ -156,7 +204,7 @@ class CurrentUserView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        return Response(UserSerializer(request.user).data)
+        return Response(_user_dict(request.user))
 
 
 class ChangePasswordView(APIView):
@@ -212,15 +260,21 @@ class ForgotPasswordView(RateLimitMixin, APIView):
             reset_token = AuthService.create_password_reset_token(email)
 
             if reset_token:
-                # Send password reset email asynchronously
+                # Send password reset email after commit, off the
+                # request path (also keeps SMTP timing out of the
+                # response, so it can't leak whether the email exists)
                 if getattr(settings, 'CELERY_TASK_ALWAYS_EAGER', False):
                     # In development/test mode, send synchronously
                     from apps.email_service.services import EmailService
-                    EmailService.send_password_reset_email(reset_token.user, reset_token.token)
+                    transaction.on_commit(
+                        lambda: EmailService.send_password_reset_email(reset_token.user, reset_token.token)
+                    )
                 else:
                     # In production, send asynchronously via Celery
                     from apps.email_service.tasks import send_password_reset_email_task
-                    send_password_reset_email_task.delay(reset_token.user.id, reset_token.token)
+                    transaction.on_commit(
+                        lambda: send_password_reset_email_task.delay(reset_token.user.id, reset_token.token)
+                    )
 
             # Always return success to prevent email enumeration
             return Response({
@@ -322,15 +376,19 @@ class ResendVerificationView(RateLimitMixin, APIView):
 
         verification_token = AuthService.create_verification_token(user)
 
-        # Send verification email asynchronously
+        # Send verification email after commit, off the request path
         if getattr(settings, 'CELERY_TASK_ALWAYS_EAGER', False):
             # In development/test mode, send synchronously
             from apps.email_service.services import EmailService
-            EmailService.send_verification_email(user, verification_token.token)
+            transaction.on_commit(
+                lambda: EmailService.send_verification_email(user, verification_token.token)
+            )
         else:
             # In production, send asynchronously via Celery
             from apps.email_service.tasks import send_verification_email_task
-            send_verification_email_task.delay(user.id, verification_token.token)
+            transaction.on_commit(
+                lambda: send_verification_email_task.delay(user.id, verification_token.token)
+            )
 
         return Response({
             'message': 'Verification email sent'
@@ -27,6 +27,19 @@ class EmailLogAdmin(ModelAdmin):
         }),
     )
 
+    def get_queryset(self, request):
+        """Skip the error_message TEXT column on the list page.
+
+        Only the changelist gets the trimmed column set: the change
+        form reads every fieldset field, and deferring those would
+        refetch each one with an extra query per detail view.
+        """
+        qs = super().get_queryset(request)
+        match = request.resolver_match
+        if match and match.url_name == f'{self.opts.app_label}_{self.opts.model_name}_changelist':
+            qs = qs.only('id', 'to_email', 'subject', 'status', 'provider', 'sent_at', 'created_at')
+        return qs
+
 
 @admin.register(EmailTemplate)
 class EmailTemplateAdmin(ModelAdmin):
@@ -52,6 +65,18 @@ class EmailTemplateAdmin(ModelAdmin):
         }),
     )
 
+    def get_queryset(self, request):
+        """Skip the html/text content TEXT columns on the list page.
+
+        Changelist only, for the same reason as EmailLogAdmin: the
+        change form would refetch every deferred fieldset field.
+        """
+        qs = super().get_queryset(request)
+        match = request.resolver_match
+        if match and match.url_name == f'{self.opts.app_label}_{self.opts.model_name}_changelist':
+            qs = qs.only('id', 'name', 'subject', 'is_active', 'updated_at', 'created_at')
+        return qs
+
     def get_readonly_fields(self, request, obj=None):
         """Make name readonly after creation to prevent breaking email references."""
         if obj:
@@ -1,6 +1,8 @@
 """Email service models for tracking sent emails."""
 
 from django.db import models
+from django.db.models import Q
+from django.db.models.functions import Upper
 import uuid
 
 
@@ -22,9 +24,10 @@ class EmailLog(models.Model):
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending', db_index=True)
     provider = models.CharField(max_length=50)  # sendgrid, resend, smtp, etc.
     provider_message_id = models.CharField(max_length=255, blank=True)
-    error_message = models.TextField(blank=True)
+    error_message = models.TextField(blank=True)  # truncated to 2KB by EmailService
+    provider_status_code = models.PositiveSmallIntegerField(null=True, blank=True)
     sent_at = models.DateTimeField(null=True, blank=True)
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)  # retention cleanup scans
     
     class Meta:
         db_table = 'email_logs'
@@ -32,6 +35,23 @@ class EmailLog(models.Model):
         indexes = [
             models.Index(fields=['to_email', '-created_at']),
             models.Index(fields=['status', '-created_at']),
+            models.Index(fields=['provider', '-created_at'], name='el_provider_created_idx'),
+            # Partial: most rows have an empty provider_message_id, so
+            # only index the ones worth looking up (webhook callbacks).
+            models.Index(
+                fields=['provider_message_id'],
+                name='el_provmsgid_idx',
+                condition=Q(provider_message_id__gt=''),
+            ),
+            # Case-insensitive recipient searches from the admin
+            models.Index(Upper('to_email'), name='el_to_email_upper_idx'),
+            # Partial: retry/stuck-email scans only touch non-terminal
+            # rows, so the index stays tiny no matter how the table grows
+            models.Index(
+                fields=['-created_at'],
+                name='el_retry_idx',
+                condition=Q(status__in=['pending', 'failed']),
+            ),
         ]
     
     def __str__(self):
@@ -54,6 +74,15 @@ class EmailTemplate(models.Model):
     class Meta:
         db_table = 'email_templates'
         ordering = ['name']
+        indexes = [
+            # Matches the (name, is_active=True) lookup in
+            # EmailService._get_template_from_db exactly
+            models.Index(
+                fields=['name'],
+                name='et_name_active_idx',
+                condition=Q(is_active=True),
+            ),
+        ]
         verbose_name = 'Email Template'
         verbose_name_plural = 'Email Templates'
 
@@ -1,16 +1,78 @@
 """Base email provider interface."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import ClassVar, Dict, Any, Optional
+
+import json
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(payload) -> bytes:
+    """Serialize a provider payload, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode('utf-8')
 
 
 class BaseEmailProvider(ABC):
     """Base class for email providers."""
-    
+
+    #: Short name used for EmailLog.provider; set on each subclass so
+    #: the hot path reads an attribute instead of munging the classname
+    PROVIDER_LABEL: ClassVar[str] = ''
+
+    # One Session per provider class: keeps HTTPS connections to the
+    # provider API alive across sends, saving a TCP+TLS handshake per
+    # email once warm.
+    _session: ClassVar[Optional[requests.Session]] = None
+
+    #: (connect, read) timeout resolved from settings on first use
+    _timeout: ClassVar[Optional[tuple]] = None
+
     def __init__(self, api_key: str, **kwargs):
         """Initialize provider with API key and optional config."""
         self.api_key = api_key
         self.config = kwargs
+
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """Get (lazily creating) the pooled HTTP session for this provider."""
+        if cls._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=50,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=frozenset(['POST']),
+                    respect_retry_after_header=True,
+                ),
+            )
+            session.mount('https://', adapter)
+            cls._session = session
+        return cls._session
+
+    @classmethod
+    def _get_timeout(cls) -> tuple:
+        """Get the (connect, read) timeout for provider HTTP calls."""
+        if cls._timeout is None:
+            from django.conf import settings
+            cls._timeout = (
+                getattr(settings, 'EMAIL_HTTP_CONNECT_TIMEOUT', 3.05),
+                getattr(settings, 'EMAIL_HTTP_READ_TIMEOUT', 10),
+            )
+        return cls._timeout
     
     @abstractmethod
     def send_email(
@@ -34,6 +96,28 @@ class BaseEmailProvider(ABC):
         """
         pass
     
+    def send_bulk(self, messages: list) -> list:
+        """
+        Send multiple emails, batching where the provider supports it.
+
+        Args:
+            messages: list of dicts with 'to_email', 'subject',
+                'html_content' and optional 'from_email'/'from_name'
+
+        Returns:
+            list: one result dict per message, same shape as send_email
+
+        The default implementation runs send_email calls concurrently
+        on a thread pool (the pooled session handles parallel requests),
+        so N sends take ~1 round-trip instead of N; providers with a
+        real batch API override this.
+        """
+        if len(messages) <= 1:
+            return [self.send_email(**message) for message in messages]
+
+        with ThreadPoolExecutor(max_workers=min(8, len(messages))) as executor:
+            return list(executor.map(lambda message: self.send_email(**message), messages))
+
     @abstractmethod
     def send_template_email(
         self,
@@ -1,15 +1,85 @@
 """Resend email provider implementation."""
 
-from typing import Dict, Any, Optional
 import requests
-from .base import BaseEmailProvider
+
+from typing import Dict, Any, Optional
+from .base import BaseEmailProvider, _json_dumps
 
 
 class ResendProvider(BaseEmailProvider):
     """Resend email provider."""
-    
+
+    PROVIDER_LABEL = 'resend'
     API_URL = "https://api.resend.com/emails"
-    
+    BATCH_URL = "https://api.resend.com/emails/batch"
+    BATCH_SIZE = 100  # Resend's batch endpoint caps at 100 emails per call
+
+    def __init__(self, api_key: str, **kwargs):
+        """Initialize provider; headers are built once, not per send."""
+        super().__init__(api_key, **kwargs)
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+
+    def send_bulk(self, messages: list) -> list:
+        """Send a batch of emails via Resend's /emails/batch endpoint."""
+        results = []
+
+        for start in range(0, len(messages), self.BATCH_SIZE):
+            chunk = messages[start:start + self.BATCH_SIZE]
+
+            payload = []
+            for message in chunk:
+                from_email = message.get('from_email') or self.config.get('default_from_email')
+                from_name = message.get('from_name') or self.config.get('default_from_name', '')
+                from_address = f"{from_name} <{from_email}>" if from_name else from_email
+
+                payload.append({
+                    "from": from_address,
+                    "to": [message['to_email']],
+                    "subject": message['subject'],
+                    "html": message['html_content']
+                })
+
+
+            try:
+                response = self._get_session().post(self.BATCH_URL, data=_json_dumps(payload), headers=self._headers, timeout=self._get_timeout())
+
+                if response.status_code == 200:
+                    data = response.json().get('data', [])
+                    for i, _ in enumerate(chunk):
+                        message_id = data[i].get('id', '') if i < len(data) else ''
+                        results.append({
+                            'success': True,
+                            'message_id': message_id,
+                            'provider': 'resend'
+                        })
+                else:
+                    results.extend({
+                        'success': False,
+                        'error': response.text[:2048],
+                        'status_code': response.status_code,
+                        'provider': 'resend'
+                    } for _ in chunk)
+
+            except requests.exceptions.Timeout as e:
+                results.extend({
+                    'success': False,
+                    'error': str(e),
+                    'transient': True,
+                    'provider': 'resend'
+                } for _ in chunk)
+
+            except Exception as e:
+                results.extend({
+                    'success': False,
+                    'error': str(e),
+                    'provider': 'resend'
+                } for _ in chunk)
+
+        return results
+
     def send_email(
         self,
         to_email: str,
@@ -37,13 +107,9 @@ class ResendProvider(BaseEmailProvider):
             "html": html_content
         }
         
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
         
         try:
-            response = requests.post(self.API_URL, json=payload, headers=headers)
+            response = self._get_session().post(self.API_URL, data=_json_dumps(payload), headers=self._headers, timeout=self._get_timeout())
             
             if response.status_code == 200:
                 data = response.json()
@@ -55,10 +121,21 @@ class ResendProvider(BaseEmailProvider):
             else:
                 return {
                     'success': False,
-                    'error': response.text,
+                    'error': response.text[:2048],
+                    'status_code': response.status_code,
                     'provider': 'resend'
                 }
         
+        except requests.exceptions.Timeout as e:
+            # Transient by definition: the caller (Celery task) can
+            # retry without treating it as a hard provider rejection
+            return {
+                'success': False,
+                'error': str(e),
+                'transient': True,
+                'provider': 'resend'
+            }
+
         except Exception as e:
             return {
                 'success': False,
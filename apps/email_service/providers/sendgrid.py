@@ -1,15 +1,123 @@
 """SendGrid email provider implementation."""
 
-from typing import Dict, Any, Optional
 import requests
-from .base import BaseEmailProvider
+
+from typing import Dict, Any, Optional
+from .base import BaseEmailProvider, _json_dumps
 
 
 class SendGridProvider(BaseEmailProvider):
     """SendGrid email provider."""
-    
+
+    PROVIDER_LABEL = 'sendgrid'
     API_URL = "https://api.sendgrid.com/v3/mail/send"
-    
+    BATCH_SIZE = 1000  # SendGrid allows up to 1000 personalizations per call
+
+    def __init__(self, api_key: str, **kwargs):
+        """Initialize provider; headers are built once, not per send."""
+        super().__init__(api_key, **kwargs)
+        self._headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
+
+    def send_bulk(self, messages: list) -> list:
+        """
+        Send a batch of emails, batching identical messages into
+        multi-personalization API calls.
+
+        SendGrid content is per-request, so only messages sharing the
+        same subject, HTML body and sender can ride one call (up to
+        BATCH_SIZE recipients each). Messages that don't share content
+        with anything else go through the base per-message path, which
+        fans them out on a thread pool.
+        """
+        # Group message indices by the fields a single API call shares
+        groups = {}
+        for index, message in enumerate(messages):
+            group_key = (
+                message['subject'],
+                message['html_content'],
+                message.get('from_email'),
+                message.get('from_name'),
+            )
+            groups.setdefault(group_key, []).append(index)
+
+        results = [None] * len(messages)
+        singles = []
+
+        for indices in groups.values():
+            if len(indices) < 2:
+                singles.extend(indices)
+                continue
+            for start in range(0, len(indices), self.BATCH_SIZE):
+                batch = indices[start:start + self.BATCH_SIZE]
+                result = self._send_personalizations([messages[i] for i in batch])
+                for i in batch:
+                    # Fresh dict per message so callers can annotate
+                    # entries independently
+                    results[i] = dict(result)
+
+        if singles:
+            singles.sort()
+            for i, result in zip(singles, super().send_bulk([messages[i] for i in singles])):
+                results[i] = result
+
+        return results
+
+    def _send_personalizations(self, chunk: list) -> Dict[str, Any]:
+        """One multi-personalization API call for identical messages."""
+        first = chunk[0]
+
+        from_email = first.get('from_email') or self.config.get('default_from_email')
+        from_name = first.get('from_name') or self.config.get('default_from_name', '')
+
+        payload = {
+            "personalizations": [{
+                "to": [{"email": message['to_email']}],
+            } for message in chunk],
+            "from": {
+                "email": from_email,
+                "name": from_name
+            },
+            "subject": first['subject'],
+            "content": [{
+                "type": "text/html",
+                "value": first['html_content']
+            }]
+        }
+
+        try:
+            response = self._get_session().post(self.API_URL, data=_json_dumps(payload), headers=self._headers, timeout=self._get_timeout())
+
+            if response.status_code == 202:
+                return {
+                    'success': True,
+                    'message_id': response.headers.get('X-Message-Id', ''),
+                    'provider': 'sendgrid'
+                }
+            return {
+                'success': False,
+                'error': response.text[:2048],
+                'status_code': response.status_code,
+                'provider': 'sendgrid'
+            }
+
+        except requests.exceptions.Timeout as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'transient': True,
+                'provider': 'sendgrid'
+            }
+
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'provider': 'sendgrid'
+            }
+
     def send_email(
         self,
         to_email: str,
@@ -39,13 +147,9 @@ class SendGridProvider(BaseEmailProvider):
             }]
         }
         
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
         
         try:
-            response = requests.post(self.API_URL, json=payload, headers=headers)
+            response = self._get_session().post(self.API_URL, data=_json_dumps(payload), headers=self._headers, timeout=self._get_timeout())
             
             if response.status_code == 202:
                 message_id = response.headers.get('X-Message-Id', '')
@@ -57,10 +161,21 @@ class SendGridProvider(BaseEmailProvider):
             else:
                 return {
                     'success': False,
-                    'error': response.text,
+                    'error': response.text[:2048],
+                    'status_code': response.status_code,
                     'provider': 'sendgrid'
                 }
         
+        except requests.exceptions.Timeout as e:
+            # Transient by definition: the caller (Celery task) can
+            # retry without treating it as a hard provider rejection
+            return {
+                'success': False,
+                'error': str(e),
+                'transient': True,
+                'provider': 'sendgrid'
+            }
+
         except Exception as e:
             return {
                 'success': False,
@@ -94,13 +209,9 @@ class SendGridProvider(BaseEmailProvider):
             "template_id": template_id
         }
         
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
         
         try:
-            response = requests.post(self.API_URL, json=payload, headers=headers)
+            response = self._get_session().post(self.API_URL, data=_json_dumps(payload), headers=self._headers, timeout=self._get_timeout())
             
             if response.status_code == 202:
                 message_id = response.headers.get('X-Message-Id', '')
@@ -112,10 +223,21 @@ class SendGridProvider(BaseEmailProvider):
             else:
                 return {
                     'success': False,
-                    'error': response.text,
+                    'error': response.text[:2048],
+                    'status_code': response.status_code,
                     'provider': 'sendgrid'
                 }
         
+        except requests.exceptions.Timeout as e:
+            # Transient by definition: the caller (Celery task) can
+            # retry without treating it as a hard provider rejection
+            return {
+                'success': False,
+                'error': str(e),
+                'transient': True,
+                'provider': 'sendgrid'
+            }
+
         except Exception as e:
             return {
                 'success': False,
@@ -1,18 +1,80 @@
 """SMTP email provider implementation."""
 
+import threading
 from typing import Dict, Any, Optional
-from django.core.mail import EmailMultiAlternatives
+from django.core.mail import EmailMultiAlternatives, get_connection
 from django.conf import settings
 from .base import BaseEmailProvider
 
 
 class SMTPProvider(BaseEmailProvider):
     """SMTP email provider using Django's email backend."""
-    
+
+    PROVIDER_LABEL = 'smtp'
+
+    # One open SMTP connection per thread: EmailMultiAlternatives.send()
+    # without an explicit connection does TCP + STARTTLS + AUTH + QUIT
+    # for every message; keeping the channel open amortizes the
+    # handshake across sends.
+    _local = threading.local()
+
     def __init__(self, **kwargs):
         """Initialize SMTP provider (uses Django settings)."""
         self.config = kwargs
-    
+
+    def _get_connection(self):
+        """Get (lazily opening) this thread's persistent SMTP connection."""
+        conn = getattr(self._local, 'conn', None)
+        max_messages = getattr(settings, 'EMAIL_POOL_MAX_MESSAGES', 100)
+        if conn is not None and getattr(self._local, 'sent', 0) >= max_messages:
+            # Recycle: some submission servers cap messages per session
+            self.close()
+            conn = None
+        if conn is None or getattr(conn, 'connection', None) is None:
+            # Ask for the concrete SMTP backend: production points
+            # settings.EMAIL_BACKEND at the Celery backend, and this
+            # provider already runs on a worker — resolving the default
+            # would enqueue a second task instead of delivering
+            conn = get_connection(backend='django.core.mail.backends.smtp.EmailBackend')
+            try:
+                conn.open()
+            except Exception:
+                # Leave it closed; send_messages will open per-send
+                pass
+            self._local.conn = conn
+            self._local.sent = 0
+        return conn
+
+    def close(self):
+        """Close this thread's SMTP connection (e.g. at worker shutdown)."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            try:
+                conn.close()
+            finally:
+                self._local.conn = None
+                self._local.sent = 0
+
+    def _build_message(
+        self,
+        to_email: str,
+        subject: str,
+        html_content: str,
+        from_email: Optional[str] = None,
+        connection=None,
+    ) -> EmailMultiAlternatives:
+        """Build the multipart message for one recipient."""
+        from_email = from_email or self.config.get('default_from_email') or settings.DEFAULT_FROM_EMAIL
+        email = EmailMultiAlternatives(
+            subject=subject,
+            body=html_content,  # Plain text fallback
+            from_email=from_email,
+            to=[to_email],
+            connection=connection,
+        )
+        email.attach_alternative(html_content, "text/html")
+        return email
+
     def send_email(
         self,
         to_email: str,
@@ -23,32 +85,58 @@ class SMTPProvider(BaseEmailProvider):
         **kwargs
     ) -> Dict[str, Any]:
         """Send email via SMTP."""
-        
-        from_email = from_email or self.config.get('default_from_email') or settings.DEFAULT_FROM_EMAIL
-        
+
         try:
-            email = EmailMultiAlternatives(
-                subject=subject,
-                body=html_content,  # Plain text fallback
-                from_email=from_email,
-                to=[to_email]
+            conn = self._get_connection()
+            email = self._build_message(
+                to_email, subject, html_content, from_email, connection=conn
             )
-            email.attach_alternative(html_content, "text/html")
             email.send()
-            
+            self._local.sent = getattr(self._local, 'sent', 0) + 1
+
             return {
                 'success': True,
                 'message_id': '',  # SMTP doesn't return message ID
                 'provider': 'smtp'
             }
-        
+
         except Exception as e:
+            # Drop the (possibly dead) connection so the next send
+            # reconnects cleanly
+            self.close()
             return {
                 'success': False,
                 'error': str(e),
                 'provider': 'smtp'
             }
-    
+
+    def send_bulk(self, messages: list) -> list:
+        """Send a batch of emails over one pipelined SMTP session."""
+        try:
+            conn = self._get_connection()
+            emails = [
+                self._build_message(
+                    message['to_email'],
+                    message['subject'],
+                    message['html_content'],
+                    message.get('from_email'),
+                    connection=conn,
+                )
+                for message in messages
+            ]
+            conn.send_messages(emails)
+            self._local.sent = getattr(self._local, 'sent', 0) + len(emails)
+            return [
+                {'success': True, 'message_id': '', 'provider': 'smtp'}
+                for _ in messages
+            ]
+        except Exception as e:
+            self.close()
+            return [
+                {'success': False, 'error': str(e), 'provider': 'smtp'}
+                for _ in messages
+            ]
+
     def send_template_email(
         self,
         to_email: str,
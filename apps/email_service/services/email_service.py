@@ -1,7 +1,17 @@
 """Main email service."""
 
-from typing import Optional, Dict, Any
+from datetime import datetime
+from functools import lru_cache
+from typing import ClassVar, Optional, Dict, Any
+import logging
+import queue
+import threading
+import time
+import uuid
+
 from django.conf import settings
+from django.core.cache import cache
+from django.test.signals import setting_changed
 from django.utils import timezone
 from django.template import Template, Context
 from django.template.loader import render_to_string
@@ -9,6 +19,98 @@ from apps.email_service.models import EmailLog, EmailTemplate
 from apps.email_service.providers import SendGridProvider, ResendProvider, SMTPProvider
 
 
+#: Cached EMAIL_ENABLED kill-switch; resolved lazily because settings
+#: may not be configured at import time
+_email_enabled = None
+
+
+def _is_email_enabled() -> bool:
+    """Check the EMAIL_ENABLED kill-switch (cached after first read)."""
+    global _email_enabled
+    if _email_enabled is None:
+        _email_enabled = getattr(settings, 'EMAIL_ENABLED', True)
+    return _email_enabled
+
+
+def _clear_provider_cache(setting=None, **kwargs):
+    """Drop cached providers when email settings change (test safety)."""
+    global _email_enabled
+    if setting is None or str(setting).startswith(('EMAIL_', 'DEFAULT_FROM_')):
+        EmailService._provider_cache.clear()
+        _email_enabled = None
+
+
+setting_changed.connect(_clear_provider_cache)
+
+logger = logging.getLogger(__name__)
+
+
+# Optional batched log writes (EMAIL_LOG_ASYNC_WRITES=True): final-state
+# EmailLog rows are queued and a daemon thread flushes them with one
+# bulk_create every ~100ms, instead of one INSERT per send. Rows queued
+# in the flush window are lost on abrupt shutdown; keep the default
+# (synchronous) unless log INSERTs are a measured bottleneck.
+_LOG_FLUSH_MS = 100
+_LOG_BATCH_SIZE = 500
+_log_queue: queue.Queue = queue.Queue(maxsize=10000)
+_log_flusher_lock = threading.Lock()
+_log_flusher_started = False
+
+
+def _log_flush_loop():
+    """Drain queued EmailLog rows into batched INSERTs."""
+    while True:
+        batch = [_log_queue.get()]
+        deadline = time.monotonic() + _LOG_FLUSH_MS / 1000.0
+        while len(batch) < _LOG_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_log_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        try:
+            EmailLog.objects.bulk_create(batch, batch_size=_LOG_BATCH_SIZE, ignore_conflicts=True)
+        except Exception:
+            logger.exception(f"Failed to flush {len(batch)} email log rows")
+
+
+def flush_log_queue() -> int:
+    """
+    Drain any queued log rows synchronously.
+
+    Called from the Celery worker_shutting_down hook so the at-most-
+    one-flush-window loss described above doesn't apply to orderly
+    shutdowns. Returns the number of rows written.
+    """
+    batch = []
+    while True:
+        try:
+            batch.append(_log_queue.get_nowait())
+        except queue.Empty:
+            break
+    if batch:
+        EmailLog.objects.bulk_create(batch, batch_size=_LOG_BATCH_SIZE, ignore_conflicts=True)
+    return len(batch)
+
+
+def _enqueue_log(email_log: 'EmailLog') -> None:
+    """Queue a log row for batched INSERT, writing inline if full."""
+    global _log_flusher_started
+    if not _log_flusher_started:
+        with _log_flusher_lock:
+            if not _log_flusher_started:
+                threading.Thread(
+                    target=_log_flush_loop, name='email-log-flusher', daemon=True
+                ).start()
+                _log_flusher_started = True
+    try:
+        _log_queue.put_nowait(email_log)
+    except queue.Full:
+        email_log.save(force_insert=True)
+
+
 class EmailService:
     """
     Generic email service that works with multiple providers.
@@ -21,25 +123,38 @@ class EmailService:
     DEFAULT_FROM_NAME = 'Your App'
     """
     
+    # Process-wide provider instances, keyed by (name, api_key).
+    # Reusing the instance keeps its pooled HTTP session (and its warm
+    # TLS connections) alive across sends.
+    _provider_cache: ClassVar[dict] = {}
+
     @classmethod
     def _get_provider(cls):
-        """Get configured email provider."""
+        """Get configured email provider (cached per settings)."""
         provider_name = getattr(settings, 'EMAIL_PROVIDER', 'smtp').lower()
         api_key = getattr(settings, 'EMAIL_PROVIDER_API_KEY', '')
-        
+
+        cache_key = (provider_name, api_key)
+        provider = cls._provider_cache.get(cache_key)
+        if provider is not None:
+            return provider
+
         config = {
             'default_from_email': getattr(settings, 'DEFAULT_FROM_EMAIL', 'noreply@example.com'),
             'default_from_name': getattr(settings, 'DEFAULT_FROM_NAME', ''),
         }
-        
+
         if provider_name == 'sendgrid':
-            return SendGridProvider(api_key, **config)
+            provider = SendGridProvider(api_key, **config)
         elif provider_name == 'resend':
-            return ResendProvider(api_key, **config)
+            provider = ResendProvider(api_key, **config)
         elif provider_name == 'smtp':
-            return SMTPProvider(**config)
+            provider = SMTPProvider(**config)
         else:
             raise ValueError(f"Unknown email provider: {provider_name}")
+
+        cls._provider_cache[cache_key] = provider
+        return provider
     
     @classmethod
     def send_email(
@@ -50,11 +165,12 @@ class EmailService:
         from_email: Optional[str] = None,
         from_name: Optional[str] = None,
         log_email: bool = True,
+        defer_log_until_result: bool = True,
         **kwargs
     ) -> Dict[str, Any]:
         """
         Send an email.
-        
+
         Args:
             to_email: Recipient email
             subject: Email subject
@@ -62,23 +178,30 @@ class EmailService:
             from_email: Sender email (optional)
             from_name: Sender name (optional)
             log_email: Whether to log this email
-            
+            defer_log_until_result: Write the log row once, after the
+                provider responds, instead of INSERT pending + UPDATE
+
         Returns:
             dict: Result from provider
         """
+        if not _is_email_enabled():
+            return {'success': False, 'error': 'EMAIL_ENABLED=False'}
+
         provider = cls._get_provider()
-        
-        # Create email log
+
+        # Create email log up front only when the caller needs a
+        # visible pending row; the default writes the final state in a
+        # single INSERT, halving DB writes per email.
         email_log = None
-        if log_email:
+        if log_email and not defer_log_until_result:
             email_log = EmailLog.objects.create(
                 to_email=to_email,
                 from_email=from_email or provider.config.get('default_from_email'),
                 subject=subject,
-                provider=provider.__class__.__name__.replace('Provider', '').lower(),
+                provider=provider.PROVIDER_LABEL,
                 status='pending'
             )
-        
+
         # Send email
         result = provider.send_email(
             to_email=to_email,
@@ -88,41 +211,190 @@ class EmailService:
             from_name=from_name,
             **kwargs
         )
-        
-        # Update log
-        if log_email and email_log:
+
+        # Log the outcome
+        if log_email:
             if result['success']:
-                email_log.status = 'sent'
-                email_log.provider_message_id = result.get('message_id', '')
-                email_log.sent_at = timezone.now()
+                updates = {
+                    'status': 'sent',
+                    'provider_message_id': result.get('message_id', ''),
+                    'sent_at': timezone.now(),
+                }
             else:
-                email_log.status = 'failed'
-                email_log.error_message = result.get('error', '')
-            email_log.save()
-        
+                updates = {
+                    'status': 'failed',
+                    # Provider error bodies can be multi-KB HTML pages;
+                    # cap them so error storms don't bloat the table
+                    'error_message': (result.get('error', '') or '')[:2048],
+                    'provider_status_code': result.get('status_code'),
+                }
+            if email_log is not None:
+                # UPDATE only the changed columns, not a full-row save
+                EmailLog.objects.filter(pk=email_log.pk).update(**updates)
+            else:
+                final_log = EmailLog(
+                    to_email=to_email,
+                    from_email=from_email or provider.config.get('default_from_email'),
+                    subject=subject,
+                    provider=provider.PROVIDER_LABEL,
+                    **updates
+                )
+                if getattr(settings, 'EMAIL_LOG_ASYNC_WRITES', False):
+                    _enqueue_log(final_log)
+                else:
+                    final_log.save(force_insert=True)
+
         return result
     
+    @classmethod
+    def send_bulk(
+        cls,
+        messages: list,
+        log_email: bool = True
+    ) -> list:
+        """
+        Send a batch of emails in as few provider calls as possible.
+
+        Args:
+            messages: list of dicts with 'to_email', 'subject',
+                'html_content' and optional 'from_email'/'from_name'
+            log_email: Whether to log these emails
+
+        Returns:
+            list: one result dict per message, same shape as send_email
+
+        N messages cost one batched HTTP call per provider batch plus
+        one bulk INSERT / one bulk UPDATE for the logs, instead of N of
+        each.
+        """
+        if not messages:
+            return []
+
+        provider = cls._get_provider()
+        provider_label = provider.PROVIDER_LABEL
+        default_from = provider.config.get('default_from_email')
+
+        email_logs = []
+        if log_email:
+            email_logs = [
+                EmailLog(
+                    to_email=message['to_email'],
+                    from_email=message.get('from_email') or default_from,
+                    subject=message['subject'],
+                    provider=provider_label,
+                    status='pending'
+                )
+                for message in messages
+            ]
+            EmailLog.objects.bulk_create(email_logs, batch_size=500)
+
+        results = provider.send_bulk(messages)
+
+        if log_email and email_logs:
+            sent_at = timezone.now()
+            for email_log, result in zip(email_logs, results):
+                if result['success']:
+                    email_log.status = 'sent'
+                    email_log.provider_message_id = result.get('message_id', '')
+                    email_log.sent_at = sent_at
+                else:
+                    email_log.status = 'failed'
+                    email_log.error_message = (result.get('error', '') or '')[:2048]
+                    email_log.provider_status_code = result.get('status_code')
+            EmailLog.objects.bulk_update(
+                email_logs,
+                ['status', 'provider_message_id', 'error_message',
+                 'provider_status_code', 'sent_at'],
+                batch_size=500
+            )
+
+        return results
+
+    #: Cache key prefix for DB template lookups (invalidated by the
+    #: post_save/post_delete receivers in receivers.py)
+    TEMPLATE_CACHE_KEY = 'email_tpl:v1:{name}'
+    TEMPLATE_CACHE_TIMEOUT = 300
+
     @classmethod
     def _get_template_from_db(cls, template_name: str) -> Optional[EmailTemplate]:
         """
         Get email template from database.
 
+        Repeated sends of the same template within 5 minutes are served
+        from the cache instead of a SELECT per email. Values are stored
+        as primitive dicts so the cache serializer stays JSON-safe.
+
         Args:
             template_name: Template identifier (e.g., 'welcome', 'password_reset')
 
         Returns:
             EmailTemplate object or None
         """
+        cache_key = cls.TEMPLATE_CACHE_KEY.format(name=template_name)
+
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return EmailTemplate(
+                id=uuid.UUID(cached['id']),
+                name=cached['name'],
+                subject=cached['subject'],
+                html_content=cached['html_content'],
+                text_content=cached['text_content'],
+                updated_at=datetime.fromisoformat(cached['updated_at']),
+            )
+
         try:
-            return EmailTemplate.objects.filter(name=template_name, is_active=True).first()
+            template = EmailTemplate.objects.filter(
+                name=template_name, is_active=True
+            ).only(
+                'id', 'name', 'subject', 'html_content', 'text_content', 'updated_at'
+            ).first()
         except Exception:
             return None
 
+        if template is not None:
+            cache.set(cache_key, {
+                'id': str(template.id),
+                'name': template.name,
+                'subject': template.subject,
+                'html_content': template.html_content,
+                'text_content': template.text_content,
+                'updated_at': template.updated_at.isoformat(),
+            }, cls.TEMPLATE_CACHE_TIMEOUT)
+
+        return template
+
+    # Compiled Template objects for DB templates, keyed by
+    # (template id, updated_at): admin edits bump updated_at, so stale
+    # versions fall out of use automatically.
+    _template_cache: ClassVar[dict] = {}
+
+    @classmethod
+    def _get_compiled_db_template(cls, db_template: EmailTemplate) -> tuple:
+        """Get (subject, html) compiled Templates for a DB template."""
+        key = (db_template.id, db_template.updated_at)
+        compiled = cls._template_cache.get(key)
+        if compiled is None:
+            if len(cls._template_cache) >= 256:
+                # Crude bound; stale versions dominate when this fills
+                cls._template_cache.clear()
+            compiled = (
+                Template(db_template.subject),
+                Template(db_template.html_content),
+            )
+            cls._template_cache[key] = compiled
+        return compiled
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _compile_template_string(template_string: str) -> Template:
+        """Compile a template string once per worker process."""
+        return Template(template_string)
+
     @classmethod
     def _render_template_string(cls, template_string: str, context: Dict[str, Any]) -> str:
         """Render a template string with context."""
-        template = Template(template_string)
-        return template.render(Context(context))
+        return cls._compile_template_string(template_string).render(Context(context))
 
     @classmethod
     def send_template_email(
@@ -156,6 +428,11 @@ class EmailService:
         Returns:
             dict: Result from provider
         """
+        # Kill-switch first: no template lookup, render or provider
+        # init when emails are globally off (dev/CI)
+        if not _is_email_enabled():
+            return {'success': False, 'error': 'EMAIL_ENABLED=False'}
+
         template_source = getattr(settings, 'USE_DB_EMAIL_TEMPLATES', 'db')
         db_template = None
         html_content = None
@@ -166,9 +443,11 @@ class EmailService:
             db_template = cls._get_template_from_db(template_name)
 
         if db_template:
-            # Use database template
-            html_content = cls._render_template_string(db_template.html_content, context)
-            email_subject = cls._render_template_string(db_template.subject, context)
+            # Use database template (compiled once per version, not per send)
+            subject_template, html_template = cls._get_compiled_db_template(db_template)
+            template_context = Context(context)
+            html_content = html_template.render(template_context)
+            email_subject = subject_template.render(template_context)
         elif template_source == 'db_only':
             # DB-only mode but template not found
             raise ValueError(f"Database template '{template_name}' not found and USE_DB_EMAIL_TEMPLATES is set to 'db_only'")
@@ -191,8 +470,115 @@ class EmailService:
             **kwargs
         )
     
+    @classmethod
+    def trigger_action(
+        cls,
+        action: str,
+        recipient: str,
+        user=None,
+        context: Optional[Dict[str, Any]] = None,
+        template_name: Optional[str] = None,
+        subject: Optional[str] = None,
+    ) -> None:
+        """
+        Send the email configured for an action.
+
+        This is the direct-call fast path: app code should call it
+        instead of firing send_email_signal, which adds a full signal
+        dispatch per email just to reach this same logic. The signal
+        stays connected as an extension point for third-party apps.
+
+        Args:
+            action: Action name (e.g., 'user_registered', 'password_reset')
+            recipient: Recipient email address
+            user: User object (optional, used for template context)
+            context: Additional context data for the email template
+            template_name: Override template name (optional)
+            subject: Override subject (optional)
+        """
+        from apps.email_service.signals import get_email_config_for_action
+        from apps.email_service.tasks import send_template_email_task
+
+        # Check if emails are globally enabled
+        if not _is_email_enabled():
+            logger.info("Emails are globally disabled (EMAIL_ENABLED=False), skipping")
+            return
+
+        if not action:
+            logger.error("Email action triggered without 'action' parameter")
+            return
+
+        if not recipient:
+            logger.error(f"Email action '{action}' triggered without 'recipient' parameter")
+            return
+
+        # Get email configuration for this action
+        email_config = get_email_config_for_action(action)
+
+        if not email_config.get('enabled', False):
+            logger.info(f"Email action '{action}' is disabled, skipping")
+            return
+
+        # Determine template and subject
+        template_name = template_name or email_config.get('template_name')
+        subject = subject or email_config.get('subject')
+
+        if not template_name:
+            logger.error(f"No template_name found for action '{action}'")
+            return
+
+        # Build email context
+        email_context = {
+            'site_name': getattr(settings, 'SITE_NAME', 'Django App'),
+            'frontend_url': getattr(settings, 'FRONTEND_URL', 'http://localhost:3000'),
+        }
+
+        # Add user to context if provided
+        if user:
+            email_context['user'] = user
+
+        # Merge with provided context
+        email_context.update(context or {})
+
+        # Send email. Off the request thread when a worker is
+        # available: the provider call is an HTTP request (100-500ms)
+        # and the caller shouldn't wait for it.
+        try:
+            if getattr(settings, 'CELERY_TASK_ALWAYS_EAGER', False):
+                result = cls.send_template_email(
+                    to_email=recipient,
+                    template_name=template_name,
+                    context=email_context,
+                    subject=subject,
+                )
+
+                if result.get('success'):
+                    logger.info(f"Email sent successfully for action '{action}' to {recipient}")
+                else:
+                    logger.error(f"Failed to send email for action '{action}' to {recipient}: {result.get('error')}")
+            else:
+                # Model instances don't survive the JSON task serializer;
+                # templates resolve dict keys the same as attributes.
+                if user is not None:
+                    email_context['user'] = {
+                        'email': getattr(user, 'email', ''),
+                        'username': getattr(user, 'username', ''),
+                        'first_name': getattr(user, 'first_name', ''),
+                        'last_name': getattr(user, 'last_name', ''),
+                    }
+                send_template_email_task.delay(
+                    to_email=recipient,
+                    template_name=template_name,
+                    context=email_context,
+                    subject=subject,
+                )
+                logger.info(f"Email for action '{action}' to {recipient} queued")
+
+        except Exception as e:
+            logger.exception(f"Exception sending email for action '{action}' to {recipient}: {str(e)}")
+
     # Convenience methods for authentication emails
-    
+
     @classmethod
     def send_verification_email(cls, user, token: str):
         """Send email verification email."""
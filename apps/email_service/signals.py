@@ -27,6 +27,8 @@ Available default actions:
     - custom: Send custom email (requires template_name and subject in context)
 """
 
+from types import MappingProxyType
+
 import django.dispatch
 
 
@@ -34,6 +36,44 @@ import django.dispatch
 send_email_signal = django.dispatch.Signal()
 
 
+# Built once at import; read-only views so a caller can't mutate the
+# shared config by accident
+_EMAIL_ACTION_CONFIGS = MappingProxyType({
+    'user_registered': MappingProxyType({
+        'template_name': 'emails/verify_email.html',
+        'subject': 'Verify your email address',
+        'enabled': True,
+    }),
+    'password_reset': MappingProxyType({
+        'template_name': 'emails/password_reset.html',
+        'subject': 'Reset your password',
+        'enabled': True,
+    }),
+    'email_verified': MappingProxyType({
+        'template_name': 'emails/welcome.html',
+        'subject': 'Welcome to our platform!',
+        'enabled': True,
+    }),
+    'password_changed': MappingProxyType({
+        'template_name': 'emails/password_changed.html',
+        'subject': 'Your password was changed',
+        'enabled': True,
+    }),
+    # Custom action - requires template_name and subject in signal context
+    'custom': MappingProxyType({
+        'template_name': None,
+        'subject': None,
+        'enabled': True,
+    }),
+})
+
+_DEFAULT_DISABLED_CONFIG = MappingProxyType({
+    'template_name': None,
+    'subject': None,
+    'enabled': False,
+})
+
+
 def get_email_config_for_action(action: str) -> dict:
     """
     Get email configuration for a specific action.
@@ -45,37 +85,4 @@ def get_email_config_for_action(action: str) -> dict:
             'enabled': bool        # Whether this action should trigger email
         }
     """
-    configs = {
-        'user_registered': {
-            'template_name': 'emails/verify_email.html',
-            'subject': 'Verify your email address',
-            'enabled': True,
-        },
-        'password_reset': {
-            'template_name': 'emails/password_reset.html',
-            'subject': 'Reset your password',
-            'enabled': True,
-        },
-        'email_verified': {
-            'template_name': 'emails/welcome.html',
-            'subject': 'Welcome to our platform!',
-            'enabled': True,
-        },
-        'password_changed': {
-            'template_name': 'emails/password_changed.html',
-            'subject': 'Your password was changed',
-            'enabled': True,
-        },
-        # Custom action - requires template_name and subject in signal context
-        'custom': {
-            'template_name': None,
-            'subject': None,
-            'enabled': True,
-        },
-    }
-
-    return configs.get(action, {
-        'template_name': None,
-        'subject': None,
-        'enabled': False,
-    })
+    return _EMAIL_ACTION_CONFIGS.get(action, _DEFAULT_DISABLED_CONFIG)
@@ -4,20 +4,186 @@ Celery tasks for email service.
 These tasks handle async email sending and maintenance operations.
 """
 
-from celery import shared_task
+from celery import group, shared_task
+from celery.signals import worker_process_init, worker_shutting_down
+from django.conf import settings
 from django.utils import timezone
 from datetime import timedelta
+from functools import cache
 from typing import Dict, Any
+from urllib.parse import quote
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+class TransientEmailError(Exception):
+    """Send failure worth retrying (timeout, 5xx, connection error)."""
+
+
+def _check_send_result(result: Dict[str, Any], description: str) -> None:
+    """Raise TransientEmailError for retryable failures.
+
+    Hard provider rejections (4xx) are returned as-is: retrying an
+    invalid address or bad payload only amplifies load.
+    """
+    if result['success']:
+        return
+    status = result.get('status_code')
+    if result.get('transient') or status is None or status >= 500:
+        raise TransientEmailError(result.get('error', 'Unknown error'))
+    logger.warning(f"{description} rejected by provider ({status}): {result.get('error')}")
+
+
+# Resolved once per process instead of re-running the import machinery
+# (and get_user_model) inside every task invocation. Lazy because the
+# app registry isn't ready when Celery imports this module.
+
+@cache
+def _user_model():
+    """Get the configured user model."""
+    from django.apps import apps as django_apps
+    return django_apps.get_model(settings.AUTH_USER_MODEL)
+
+
+def _fetch_user_fields(user_id) -> dict:
+    """
+    Get the minimal user fields the email templates need.
+
+    Avoids hydrating the full user row (password hash, flags, profile
+    columns) just to read an address and a name; the returned dict
+    also passes through the JSON task serializer unchanged, and
+    templates resolve dict keys the same as attributes.
+    """
+    return (
+        _user_model().objects
+        .filter(id=user_id)
+        .values('id', 'email', 'first_name', 'last_name')
+        .first()
+    )
+
+
+@cache
+def _url_parts() -> dict:
+    """
+    Frontend URL prefixes and site name, resolved once per process.
+
+    Tasks run at high rates; rebuilding these strings (and taking the
+    getattr miss path for SITE_NAME) per invocation is pure waste.
+    Lazy for the same app-registry reason as _user_model.
+    """
+    frontend = settings.FRONTEND_URL.rstrip('/')
+    return {
+        'site_name': getattr(settings, 'SITE_NAME', 'Your App'),
+        'verify_prefix': frontend + '/verify-email?token=',
+        'reset_prefix': frontend + '/reset-password?token=',
+        'login_url': frontend + '/login',
+    }
+
+
+@cache
+def _email_service():
+    """Get the EmailService class."""
+    from apps.email_service.services import EmailService
+    return EmailService
+
+
+@worker_process_init.connect
+def prewarm_email_templates(**kwargs):
+    """
+    Compile the known action templates at worker boot.
+
+    Django's cached template loader compiles lazily, so without this
+    the first email of each kind in every worker process pays the
+    template lex/parse cost inside a task.
+    """
+    from django.template.loader import get_template
+    from apps.email_service.signals import get_email_config_for_action
+
+    for action in ('user_registered', 'password_reset', 'email_verified', 'password_changed'):
+        template_name = get_email_config_for_action(action).get('template_name')
+        if not template_name:
+            continue
+        try:
+            get_template(template_name)
+        except Exception:
+            logger.warning(f"Could not prewarm email template '{template_name}'")
+
+
+@worker_shutting_down.connect
+def close_provider_connections(**kwargs):
+    """Flush buffered logs and close SMTP connections before exit."""
+    from apps.email_service.services.email_service import flush_log_queue
+
+    flushed = flush_log_queue()
+    if flushed:
+        logger.info(f"Flushed {flushed} buffered email log rows on shutdown")
+
+    for provider in _email_service()._provider_cache.values():
+        close = getattr(provider, 'close', None)
+        if close is not None:
+            close()
+
+
+def send_template_emails_bulk(payloads: list) -> object:
+    """
+    Publish one send_template_email_task per payload over a single
+    broker connection.
+
+    Looping apply_async pays one broker round-trip per task; acquiring
+    a producer from the pool and publishing the whole group through it
+    collapses N round-trips into a pipelined burst.
+
+    Args:
+        payloads: list of kwargs dicts for send_template_email_task
+
+    Returns:
+        GroupResult, or None for an empty list
+    """
+    if not payloads or not _emails_enabled():
+        return None
+
+    signatures = [send_template_email_task.s(**payload) for payload in payloads]
+    app = send_template_email_task.app
+    with app.producer_pool.acquire(block=True) as producer:
+        return group(signatures).apply_async(producer=producer)
+
+
+def _emails_enabled() -> bool:
+    """Check the cached EMAIL_ENABLED kill-switch."""
+    from apps.email_service.services.email_service import _is_email_enabled
+    if _is_email_enabled():
+        return True
+    logger.debug("Emails are globally disabled (EMAIL_ENABLED=False), skipping publish")
+    return False
+
+
+def send_template_email_async(**kwargs):
+    """
+    Publish send_template_email_task, or no-op when emails are off.
+
+    Publishing a task costs serialization plus a broker round-trip
+    that a disabled-email deployment (tests, sandboxes) would pay just
+    for the worker to drop the send. Callers should prefer this over
+    .delay()/.apply_async() directly.
+
+    Returns:
+        AsyncResult, or None when EMAIL_ENABLED is False
+    """
+    if not _emails_enabled():
+        return None
+    return send_template_email_task.apply_async(kwargs=kwargs)
+
+
 @shared_task(
     bind=True,
+    typing=False,  # skip per-call signature reflection on the hot tasks
+    ignore_result=True,
     max_retries=3,
-    default_retry_delay=60,  # Retry after 60 seconds
-    autoretry_for=(Exception,),
+    autoretry_for=(TransientEmailError,),
+    retry_backoff=60,
+    retry_backoff_max=900,
+    retry_jitter=True,
 )
 def send_email_task(
     self,
@@ -27,7 +193,7 @@ def send_email_task(
     from_email: str = None,
     from_name: str = None,
     log_email: bool = True,
-    **kwargs
+    extra: Dict[str, Any] = None,
 ) -> Dict[str, Any]:
     """
     Async task to send an email.
@@ -43,38 +209,36 @@ def send_email_task(
     Returns:
         dict: Result from provider
     """
-    from apps.email_service.services import EmailService
-
     try:
-        result = EmailService.send_email(
+        result = _email_service().send_email(
             to_email=to_email,
             subject=subject,
             html_content=html_content,
             from_email=from_email,
             from_name=from_name,
             log_email=log_email,
-            **kwargs
+            **(extra or {})
         )
-
-        if not result['success']:
-            logger.warning(f"Email to {to_email} failed: {result.get('error')}")
-            # Retry if failed
-            raise Exception(result.get('error', 'Unknown error'))
-
-        logger.info(f"Email sent successfully to {to_email}")
-        return result
-
     except Exception as exc:
-        logger.error(f"Error sending email to {to_email}: {str(exc)}")
-        # Retry with exponential backoff
-        raise self.retry(exc=exc, countdown=2 ** self.request.retries * 60)
+        # Coding/config errors (bad payload, broken template) are not
+        # recoverable by retrying; fail fast instead of pinning a
+        # worker on three doomed backoff cycles
+        logger.error(f"Non-retryable failure sending email to {to_email}: {exc}")
+        return {'success': False, 'error': str(exc)}
+
+    _check_send_result(result, f"Email to {to_email}")
+    return result
 
 
 @shared_task(
     bind=True,
+    typing=False,
+    ignore_result=True,
     max_retries=3,
-    default_retry_delay=60,
-    autoretry_for=(Exception,),
+    autoretry_for=(TransientEmailError,),
+    retry_backoff=60,
+    retry_backoff_max=900,
+    retry_jitter=True,
 )
 def send_template_email_task(
     self,
@@ -85,7 +249,7 @@ def send_template_email_task(
     from_email: str = None,
     from_name: str = None,
     log_email: bool = True,
-    **kwargs
+    extra: Dict[str, Any] = None,
 ) -> Dict[str, Any]:
     """
     Async task to send a template-based email.
@@ -102,10 +266,8 @@ def send_template_email_task(
     Returns:
         dict: Result from provider
     """
-    from apps.email_service.services import EmailService
-
     try:
-        result = EmailService.send_template_email(
+        result = _email_service().send_template_email(
             to_email=to_email,
             template_name=template_name,
             context=context,
@@ -113,143 +275,226 @@ def send_template_email_task(
             from_email=from_email,
             from_name=from_name,
             log_email=log_email,
-            **kwargs
+            **(extra or {})
         )
+    except Exception as exc:
+        logger.error(f"Non-retryable failure sending '{template_name}' to {to_email}: {exc}")
+        return {'success': False, 'error': str(exc)}
 
-        if not result['success']:
-            logger.warning(f"Template email '{template_name}' to {to_email} failed: {result.get('error')}")
-            raise Exception(result.get('error', 'Unknown error'))
+    _check_send_result(result, f"Template email '{template_name}' to {to_email}")
+    return result
 
-        logger.info(f"Template email '{template_name}' sent successfully to {to_email}")
-        return result
 
-    except Exception as exc:
-        logger.error(f"Error sending template email to {to_email}: {str(exc)}")
-        raise self.retry(exc=exc, countdown=2 ** self.request.retries * 60)
+# Account-lifecycle emails differ only by template, context URL and
+# subject; one parameterized task keeps a single code path (and a
+# single bulk-dispatch target) instead of three near-copies.
+_LIFECYCLE = {
+    'verify': ('emails/verify_email.html', 'verification_url', 'verify_prefix', 'Verify your email address'),
+    'reset': ('emails/password_reset.html', 'reset_url', 'reset_prefix', 'Reset your password'),
+    'welcome': ('emails/welcome.html', None, None, 'Welcome to our platform!'),
+}
 
 
-@shared_task(bind=True)
-def send_verification_email_task(self, user_id: int, token: str):
+@shared_task(
+    bind=True,
+    ignore_result=True,
+    max_retries=3,
+    autoretry_for=(TransientEmailError,),
+    retry_backoff=60,
+    retry_backoff_max=900,
+    retry_jitter=True,
+    # 0 is the *highest* priority on kombu's Redis transport
+    # (queue_order_strategy 'priority'): login-blocking emails jump
+    # the queue under load
+    priority=0,
+)
+def send_account_lifecycle_email(self, user_id: int, kind: str, token: str = None):
     """
-    Async task to send email verification email.
+    Async task to send a verification, reset or welcome email.
 
     Args:
         user_id: User ID
-        token: Verification token
+        kind: 'verify', 'reset' or 'welcome'
+        token: Verification/reset token (unused for 'welcome')
     """
-    from django.contrib.auth import get_user_model
-    from django.conf import settings
-
-    User = get_user_model()
+    template_name, url_key, prefix_key, subject = _LIFECYCLE[kind]
 
-    try:
-        user = User.objects.get(id=user_id)
-    except User.DoesNotExist:
+    user = _fetch_user_fields(user_id)
+    if user is None:
         logger.error(f"User with ID {user_id} not found")
         return {'success': False, 'error': 'User not found'}
 
-    verification_url = f"{settings.FRONTEND_URL}/verify-email?token={token}"
-
+    parts = _url_parts()
     context = {
         'user': user,
-        'verification_url': verification_url,
-        'site_name': getattr(settings, 'SITE_NAME', 'Your App'),
+        'site_name': parts['site_name'],
     }
+    if url_key is not None:
+        context[url_key] = parts[prefix_key] + quote(token or '', safe='')
+    else:
+        context['login_url'] = parts['login_url']
 
-    return send_template_email_task.apply_async(
-        kwargs={
-            'to_email': user.email,
-            'template_name': 'emails/verify_email.html',
-            'context': context,
-            'subject': 'Verify your email address',
-        }
-    )
+    # Already on a worker: send directly instead of enqueueing a second
+    # task (one more broker round-trip) just to get here again
+    try:
+        result = _email_service().send_template_email(
+            to_email=user['email'],
+            template_name=template_name,
+            context=context,
+            subject=subject,
+        )
+    except Exception as exc:
+        logger.error(f"Non-retryable failure sending '{kind}' email to {user['email']}: {exc}")
+        return {'success': False, 'error': str(exc)}
+
+    _check_send_result(result, f"Lifecycle email '{kind}' to {user['email']}")
+    return result
 
 
-@shared_task(bind=True)
+@shared_task(bind=True, ignore_result=True, max_retries=3,
+             autoretry_for=(TransientEmailError,), retry_backoff=60,
+             retry_backoff_max=900, retry_jitter=True, priority=0)
+def send_verification_email_task(self, user_id: int, token: str):
+    """Backward-compatible shim over send_account_lifecycle_email."""
+    return send_account_lifecycle_email(user_id, 'verify', token)
+
+
+@shared_task(bind=True, ignore_result=True, max_retries=3,
+             autoretry_for=(TransientEmailError,), retry_backoff=60,
+             retry_backoff_max=900, retry_jitter=True, priority=0)
 def send_password_reset_email_task(self, user_id: int, token: str):
+    """Backward-compatible shim over send_account_lifecycle_email."""
+    return send_account_lifecycle_email(user_id, 'reset', token)
+
+
+@shared_task(bind=True, ignore_result=True, max_retries=3,
+             autoretry_for=(TransientEmailError,), retry_backoff=60,
+             retry_backoff_max=900, retry_jitter=True, priority=4)
+def send_welcome_email_task(self, user_id: int):
+    """Backward-compatible shim over send_account_lifecycle_email."""
+    return send_account_lifecycle_email(user_id, 'welcome')
+
+
+def send_verification_emails_bulk(token_map: Dict[int, str]) -> object:
     """
-    Async task to send password reset email.
+    Enqueue verification emails for many users in one shot.
 
     Args:
-        user_id: User ID
-        token: Reset token
+        token_map: {user_id: verification_token}
     """
-    from django.contrib.auth import get_user_model
-    from django.conf import settings
+    User = _user_model()
 
-    User = get_user_model()
+    users = User.objects.filter(id__in=token_map).values('id', 'email', 'first_name', 'last_name')
+    parts = _url_parts()
 
-    try:
-        user = User.objects.get(id=user_id)
-    except User.DoesNotExist:
-        logger.error(f"User with ID {user_id} not found")
-        return {'success': False, 'error': 'User not found'}
+    payloads = [
+        {
+            'to_email': user['email'],
+            'template_name': 'emails/verify_email.html',
+            'context': {
+                'user': user,
+                'verification_url': parts['verify_prefix'] + quote(token_map[user['id']], safe=''),
+                'site_name': parts['site_name'],
+            },
+            'subject': 'Verify your email address',
+        }
+        for user in users
+    ]
+    return send_template_emails_bulk(payloads)
 
-    reset_url = f"{settings.FRONTEND_URL}/reset-password?token={token}"
 
-    context = {
-        'user': user,
-        'reset_url': reset_url,
-        'site_name': getattr(settings, 'SITE_NAME', 'Your App'),
-    }
+def send_password_reset_emails_bulk(token_map: Dict[int, str]) -> object:
+    """
+    Enqueue password reset emails for many users in one shot.
+
+    Args:
+        token_map: {user_id: reset_token}
+    """
+    User = _user_model()
+
+    users = User.objects.filter(id__in=token_map).values('id', 'email', 'first_name', 'last_name')
+    parts = _url_parts()
 
-    return send_template_email_task.apply_async(
-        kwargs={
-            'to_email': user.email,
+    payloads = [
+        {
+            'to_email': user['email'],
             'template_name': 'emails/password_reset.html',
-            'context': context,
+            'context': {
+                'user': user,
+                'reset_url': parts['reset_prefix'] + quote(token_map[user['id']], safe=''),
+                'site_name': parts['site_name'],
+            },
             'subject': 'Reset your password',
         }
-    )
+        for user in users
+    ]
+    return send_template_emails_bulk(payloads)
 
 
-@shared_task(bind=True)
-def send_welcome_email_task(self, user_id: int):
+def send_welcome_emails_bulk(user_ids: list) -> object:
     """
-    Async task to send welcome email.
+    Enqueue welcome emails for many users in one shot.
 
     Args:
-        user_id: User ID
+        user_ids: list of user IDs
     """
-    from django.contrib.auth import get_user_model
-    from django.conf import settings
-
-    User = get_user_model()
+    User = _user_model()
 
-    try:
-        user = User.objects.get(id=user_id)
-    except User.DoesNotExist:
-        logger.error(f"User with ID {user_id} not found")
-        return {'success': False, 'error': 'User not found'}
+    users = User.objects.filter(id__in=user_ids).values('id', 'email', 'first_name', 'last_name')
+    parts = _url_parts()
 
-    context = {
-        'user': user,
-        'site_name': getattr(settings, 'SITE_NAME', 'Your App'),
-        'login_url': f"{settings.FRONTEND_URL}/login",
-    }
-
-    return send_template_email_task.apply_async(
-        kwargs={
-            'to_email': user.email,
+    payloads = [
+        {
+            'to_email': user['email'],
             'template_name': 'emails/welcome.html',
-            'context': context,
+            'context': {
+                'user': user,
+                'site_name': parts['site_name'],
+                'login_url': parts['login_url'],
+            },
             'subject': 'Welcome to our platform!',
         }
-    )
+        for user in users
+    ]
+    return send_template_emails_bulk(payloads)
 
 
-@shared_task
-def cleanup_old_email_logs():
+# Lowest priority (9): maintenance must never outrank real sends
+@shared_task(ignore_result=True, priority=9)
+def cleanup_old_email_logs(batch_size: int = 10000):
     """
     Cleanup old email logs (older than 90 days).
 
     This is a periodic task that runs daily via Celery Beat.
+
+    Deletes in pk batches via _raw_delete: a single queryset delete
+    would pull every doomed pk through the cascade collector in one
+    go, which is memory-heavy and holds one huge transaction on a
+    table this size. EmailLog has no inbound FKs or delete signals, so
+    skipping the collector is safe.
     """
+    from django.db import connection, transaction
+
     from apps.email_service.models import EmailLog
 
     cutoff_date = timezone.now() - timedelta(days=90)
-    deleted_count, _ = EmailLog.objects.filter(created_at__lt=cutoff_date).delete()
+    deleted_count = 0
+
+    while True:
+        # Each batch claims its pks with SKIP LOCKED (where supported)
+        # inside a short transaction, so several cleanup workers can
+        # run concurrently without fighting over rows.
+        with transaction.atomic():
+            expired = EmailLog.objects.filter(created_at__lt=cutoff_date)
+            if connection.features.has_select_for_update_skip_locked:
+                expired = expired.select_for_update(skip_locked=True)
+            pks = list(expired.values_list('pk', flat=True)[:batch_size])
+            if not pks:
+                break
+            batch = EmailLog.objects.filter(pk__in=pks)
+            deleted_count += batch._raw_delete(using=batch.db)
+        if len(pks) < batch_size:
+            break
 
     logger.info(f"Cleaned up {deleted_count} old email logs")
     return {'deleted_count': deleted_count}
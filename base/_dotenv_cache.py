@@ -0,0 +1,61 @@
+"""
+Cached .env loading for process entrypoints.
+
+``load_dotenv`` re-parses the whole .env file on every interpreter
+start — once per gunicorn worker without ``--preload``, once per Celery
+worker, once per management command. The parse result is a small
+``dict[str, str]``, so it is cached as JSON keyed by the .env file's
+mtime; unchanged files skip the parser entirely on subsequent boots.
+"""
+
+import json
+import os
+from pathlib import Path
+
+_CACHE_DIR = Path(os.getenv('XDG_CACHE_HOME', Path.home() / '.cache')) / 'django-crud'
+
+
+def load_env(env_path):
+    """Load ``env_path`` into os.environ, reusing a cached parse.
+
+    Matches ``load_dotenv`` semantics: existing environment variables are
+    not overridden. Missing .env files and unwritable cache directories
+    are silently tolerated, like ``load_dotenv`` itself.
+    """
+    env_path = Path(env_path)
+    try:
+        mtime_ns = env_path.stat().st_mtime_ns
+    except OSError:
+        return False
+
+    cache_file = _CACHE_DIR / 'dotenv.json'
+    values = None
+    try:
+        with open(cache_file) as f:
+            cached = json.load(f)
+        if cached.get('path') == str(env_path) and cached.get('mtime_ns') == mtime_ns:
+            values = cached.get('values')
+    except (OSError, ValueError):
+        pass
+
+    if values is None:
+        try:
+            from dotenv import dotenv_values
+        except ImportError:
+            return False
+        values = {k: v for k, v in dotenv_values(env_path).items() if v is not None}
+        try:
+            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+            # The cache holds .env secrets in plaintext: owner-only,
+            # like the mode ssh/pip give their secret-bearing files
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'path': str(env_path), 'mtime_ns': mtime_ns, 'values': values}, f)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass  # Cache is best-effort
+
+    for key, value in values.items():
+        os.environ.setdefault(key, value)
+    return True
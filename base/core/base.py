@@ -6,17 +6,26 @@ Environment-specific settings are in development.py and production.py
 """
 
 from pathlib import Path
-from dotenv import load_dotenv
 import os
 import sys
 from datetime import timedelta
 
-load_dotenv()
+from base._dotenv_cache import load_env
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 # This points to the project root (django-plugin/)
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
+# Same mtime-cached .env loader the WSGI/ASGI entrypoints use; a plain
+# load_dotenv() here re-parsed the file on every settings import and
+# made the entrypoint-level cache pointless.
+load_env(BASE_DIR / '.env')
+
+
+def envbool(key, default='False'):
+    """Read a boolean env var, accepting 1/true/yes/on (case-insensitive)."""
+    return os.environ.get(key, default).lower() in ('1', 'true', 'yes', 'on')
+
 # Add apps directory to Python path
 sys.path.insert(0, str(BASE_DIR / 'apps'))
 
@@ -62,6 +71,7 @@ THIRD_PARTY_APPS = [
     'corsheaders',
     'channels',
     'django_filters',
+    'djcelery_email',  # Celery-delivered django.core.mail (used in production)
 ]
 
 # Local Apps (add your apps here)
@@ -290,7 +300,7 @@ CACHES = {
                 'max_connections': 50,
                 'retry_on_timeout': True,
             },
-            'SERIALIZER': 'django_redis.serializers.json.JSONSerializer',
+            'SERIALIZER': 'base.cache_serializers.OrjsonSerializer',  # JSON wire format, orjson speed
             'COMPRESSOR': 'django_redis.compressors.zlib.ZlibCompressor',
         },
         'TIMEOUT': 3600,  # 1 hour default timeout
@@ -314,19 +324,52 @@ SESSION_SAVE_EVERY_REQUEST = False
 # CELERY CONFIGURATION
 # =============================================================================
 
+# When Redis is colocated with the workers, point this at the UNIX
+# socket (e.g. redis+socket:///var/run/redis/redis.sock?virtual_host=0)
+# to skip the TCP stack; hiredis (in requirements) gives redis-py its
+# C protocol parser either way.
 CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL', 'redis://localhost:6379/0')
 CELERY_RESULT_BACKEND = os.getenv('CELERY_RESULT_BACKEND', 'redis://localhost:6379/0')
-CELERY_ACCEPT_CONTENT = ['json']
-CELERY_TASK_SERIALIZER = 'json'
-CELERY_RESULT_SERIALIZER = 'json'
+# Fire-and-forget by default: no task in this project awaits a result,
+# so skip the per-task Redis result write. Opt back in per task with
+# ignore_result=False; any stored results expire after an hour.
+CELERY_TASK_IGNORE_RESULT = True
+CELERY_RESULT_EXPIRES = 3600
+# msgpack emits fewer bytes and parses faster than json for the nested
+# context dicts the email tasks carry; json stays accepted so messages
+# already on the broker still deserialize during rollout
+CELERY_ACCEPT_CONTENT = ['msgpack', 'json']
+CELERY_TASK_SERIALIZER = 'msgpack'
+CELERY_RESULT_SERIALIZER = 'msgpack'
+# Compress task bodies: rich template contexts are multi-KB and zstd
+# shrinks them ~5-10x for little CPU, cutting broker memory/traffic
+CELERY_TASK_COMPRESSION = 'zstd'
 CELERY_TIMEZONE = TIME_ZONE
 CELERY_ENABLE_UTC = True
 CELERY_ENABLE_LOGGING = True
 
 # Celery performance optimizations
 CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
+CELERY_BROKER_TRANSPORT_OPTIONS = {
+    'socket_keepalive': True,
+    # Priority support: user-facing sends (verify/reset) jump ahead of
+    # bulk welcome blasts and maintenance when the queue backs up
+    'priority_steps': list(range(10)),
+    'queue_order_strategy': 'priority',
+}
+CELERY_TASK_DEFAULT_PRIORITY = 5
 CELERY_TASK_ACKS_LATE = True
-CELERY_WORKER_PREFETCH_MULTIPLIER = 4
+# Email tasks are short and I/O-bound (they block on SMTP/HTTP); keep
+# them off the default queue so other work isn't stuck behind a send
+# storm. Run the email workers with something like:
+#   celery -A base worker -Q emails --pool=gevent --concurrency=200 --prefetch-multiplier=1
+CELERY_TASK_ROUTES = {
+    'apps.email_service.tasks.*': {'queue': 'emails'},
+}
+# Email/IO-bound tasks with acks_late: prefetch 1 so short tasks aren't
+# reserved behind a long send on a busy worker (pair with `-O fair`)
+CELERY_WORKER_PREFETCH_MULTIPLIER = int(os.getenv('CELERY_WORKER_PREFETCH_MULTIPLIER', '1'))
+CELERY_WORKER_DISABLE_RATE_LIMITS = True
 CELERY_WORKER_MAX_TASKS_PER_CHILD = 1000
 CELERY_TASK_TIME_LIMIT = 300  # 5 minutes
 CELERY_TASK_SOFT_TIME_LIMIT = 240  # 4 minutes
@@ -345,11 +388,15 @@ DEFAULT_FROM_EMAIL = 'noreply@example.com'
 SERVER_EMAIL = 'server@example.com'
 
 # Email Service Configuration
-EMAIL_ENABLED = os.getenv('EMAIL_ENABLED', 'True').lower() in ['true', '1', 'yes']  # Global email enable/disable
+EMAIL_ENABLED = envbool('EMAIL_ENABLED', 'True')  # Global email enable/disable
 EMAIL_PROVIDER = os.getenv('EMAIL_PROVIDER', 'smtp')  # 'sendgrid', 'resend', or 'smtp'
 EMAIL_PROVIDER_API_KEY = os.getenv('EMAIL_PROVIDER_API_KEY', '')
 DEFAULT_FROM_NAME = os.getenv('DEFAULT_FROM_NAME', 'Django App')
 
+# SMTP connection reuse: messages sent over one persistent connection
+# before it is recycled (guards against servers that cap RCPTs/session)
+EMAIL_POOL_MAX_MESSAGES = int(os.getenv('EMAIL_POOL_MAX_MESSAGES', '100'))
+
 # Email Template Source Configuration
 # Set to 'db' to use database templates first (fallback to static)
 # Set to 'static' to only use static template files
@@ -361,16 +408,16 @@ FRONTEND_URL = os.getenv('FRONTEND_URL', 'http://localhost:3000')
 SITE_NAME = os.getenv('SITE_NAME', 'Django App')
 
 # Authentication Configuration
-AUTO_VERIFY_USERS = os.getenv('AUTO_VERIFY_USERS', 'False').lower() in ['true', '1', 'yes']
-SKIP_VERIFICATION_EMAIL = os.getenv('SKIP_VERIFICATION_EMAIL', 'False').lower() in ['true', '1', 'yes']
+AUTO_VERIFY_USERS = envbool('AUTO_VERIFY_USERS')
+SKIP_VERIFICATION_EMAIL = envbool('SKIP_VERIFICATION_EMAIL')
 
 # =============================================================================
 # LOGGING CONFIGURATION
 # =============================================================================
 
-# Ensure logs directory exists
-LOGS_DIR = BASE_DIR / 'logs'
-LOGS_DIR.mkdir(parents=True, exist_ok=True)
+# The file handler creates this on first use (see base.log_handlers);
+# no mkdir at import time, which runs for every command and worker fork
+LOGS_DIR = Path(os.getenv('DJANGO_LOGS_DIR', BASE_DIR / 'logs'))
 
 LOGGING = {
     'version': 1,
@@ -401,8 +448,8 @@ LOGGING = {
         },
         'file': {
             'level': 'INFO',
-            'class': 'logging.handlers.RotatingFileHandler',
-            'filename': BASE_DIR / 'logs' / 'django.log',
+            'class': 'base.log_handlers.AutoDirRotatingFileHandler',
+            'filename': LOGS_DIR / 'django.log',
             'maxBytes': 1024 * 1024 * 15,  # 15MB
             'backupCount': 10,
             'formatter': 'verbose',
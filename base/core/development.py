@@ -28,7 +28,7 @@ CORS_ALLOW_CREDENTIALS = True
 # =============================================================================
 
 # Use PostgreSQL if USE_POSTGRES=True in .env, otherwise use SQLite
-if os.getenv('USE_POSTGRES', 'False').lower() == 'true':
+if envbool('USE_POSTGRES'):
     DATABASES = {
         'default': {
             'ENGINE': 'django.db.backends.postgresql',
@@ -7,6 +7,7 @@ with proper security, connection pooling (PgBouncer), caching, and async support
 
 from .base import *
 import os
+import socket
 import dj_database_url
 import psycopg2.extensions
 
@@ -34,11 +35,12 @@ if not SECRET_KEY:
 
 CORS_ALLOW_ALL_ORIGINS = False  # Disabled for production security
 
-cors_origins_env = os.getenv('CORS_ALLOWED_ORIGINS')
-if cors_origins_env:
-    CORS_ALLOWED_ORIGINS = [origin.strip() for origin in cors_origins_env.split(',') if origin.strip()]
-else:
-    CORS_ALLOWED_ORIGINS = []
+# Parsed once at startup; origins are scheme://host and case-
+# insensitive, so normalize to lowercase here rather than per request
+cors_origins_env = os.getenv('CORS_ALLOWED_ORIGINS', '')
+CORS_ALLOWED_ORIGINS = tuple(
+    origin.strip().lower() for origin in cors_origins_env.split(',') if origin.strip()
+)
 
 CORS_ALLOW_CREDENTIALS = True
 CORS_ALLOWED_HEADERS = [
@@ -77,7 +79,9 @@ if DATABASE_URL:
         'default': dj_database_url.config(
             default=DATABASE_URL,
             conn_max_age=0,  # Disable persistent connections - PgBouncer manages this
-            conn_health_checks=True,  # Enable connection health checks
+            # Health checks issue a SELECT 1 per request; PgBouncer's
+            # server_check_query already validates pooled backends
+            conn_health_checks=False,
             engine='django.db.backends.postgresql'
         )
     }
@@ -91,6 +95,11 @@ if DATABASE_URL:
         'connect_timeout': 5,
         'isolation_level': psycopg2.extensions.ISOLATION_LEVEL_READ_COMMITTED,
     }
+
+    # Under transaction pooling the DECLARE and FETCH of a server-side
+    # cursor can land on different backends, so .iterator() queries
+    # break; client-side cursors keep connection sharing working
+    DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = True
 else:
     # Fallback to environment variables
     DATABASES = {
@@ -102,6 +111,7 @@ else:
             'HOST': os.getenv('DB_HOST', 'localhost'),
             'PORT': os.getenv('DB_PORT', '6432'),  # PgBouncer default port
             'CONN_MAX_AGE': 0,  # Disable - PgBouncer manages connections
+            'DISABLE_SERVER_SIDE_CURSORS': True,  # Required for transaction pooling
             'OPTIONS': {
                 'connect_timeout': 5,
                 'isolation_level': psycopg2.extensions.ISOLATION_LEVEL_READ_COMMITTED,
@@ -147,13 +157,28 @@ CACHES = {
         'LOCATION': os.getenv('REDIS_URL', 'redis://localhost:6379/1'),
         'OPTIONS': {
             'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            # BlockingConnectionPool makes a worker wait (up to `timeout`)
+            # for a free connection instead of raising ConnectionError when
+            # the pool is exhausted under burst load
+            'CONNECTION_POOL_CLASS': 'redis.connection.BlockingConnectionPool',
             'CONNECTION_POOL_KWARGS': {
-                'max_connections': 100,  # Increased for high concurrency
+                'max_connections': int(os.getenv('REDIS_MAX_CONNECTIONS', '50')),
+                'timeout': 2.0,  # Wait for a free connection before erroring
                 'retry_on_timeout': True,
                 'socket_keepalive': True,
+                'socket_keepalive_options': {
+                    socket.TCP_KEEPIDLE: 60,
+                    socket.TCP_KEEPINTVL: 10,
+                    socket.TCP_KEEPCNT: 3,
+                },
             },
-            'SERIALIZER': 'django_redis.serializers.json.JSONSerializer',
-            'COMPRESSOR': 'django_redis.compressors.zlib.ZlibCompressor',
+            # msgpack packs/unpacks primitives several times faster than
+            # json and produces smaller payloads; everything we cache
+            # (template rows, sessions) is primitive dicts/lists
+            'SERIALIZER': 'django_redis.serializers.msgpack.MSGPackSerializer',
+            # lz4 trades a few percent of ratio for ~10x faster
+            # decompress than zlib; cache reads dominate here
+            'COMPRESSOR': 'django_redis.compressors.lz4.Lz4Compressor',
             'SOCKET_CONNECT_TIMEOUT': 5,
             'SOCKET_TIMEOUT': 5,
             'IGNORE_EXCEPTIONS': True,  # Fail gracefully if Redis is down
@@ -164,9 +189,18 @@ CACHES = {
     }
 }
 
+# Sessions get their own Redis DB so LRU pressure from application
+# cache entries can never evict live sessions (and vice versa)
+CACHES['sessions'] = {
+    **CACHES['default'],
+    'LOCATION': os.getenv('SESSION_REDIS_URL', 'redis://localhost:6379/2'),
+    'TIMEOUT': 86400,  # Match SESSION_COOKIE_AGE
+    'KEY_PREFIX': 'django_sess',
+}
+
 # Session storage using Redis for scalability
 SESSION_ENGINE = 'django.contrib.sessions.backends.cache'
-SESSION_CACHE_ALIAS = 'default'
+SESSION_CACHE_ALIAS = 'sessions'
 SESSION_COOKIE_AGE = 86400  # 24 hours
 SESSION_SAVE_EVERY_REQUEST = False  # Reduce Redis writes
 
@@ -178,9 +212,32 @@ CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL', 'redis://localhost:6379/0')
 CELERY_RESULT_BACKEND = os.getenv('CELERY_RESULT_BACKEND', 'redis://localhost:6379/0')
 
 # Celery performance optimizations for high throughput
-CELERY_BROKER_POOL_LIMIT = 50
+# Per producer process; publishes are fast GET/SET-style ops, so a
+# handful of slots suffices and idle sockets just cost Redis memory
+CELERY_BROKER_POOL_LIMIT = int(os.getenv('CELERY_BROKER_POOL_LIMIT', '10'))
+CELERY_BROKER_CHANNEL_ERROR_RETRY = True
+# Keep monitoring/event queues from leaking keys in Redis
+CELERY_EVENT_QUEUE_EXPIRES = 60
+CELERY_EVENT_QUEUE_TTL = 5
+# Production transport tuning. This assignment replaces the dict from
+# base.py, so the priority keys are repeated here alongside the
+# visibility/health settings.
+CELERY_BROKER_TRANSPORT_OPTIONS = {
+    'socket_keepalive': True,
+    'priority_steps': list(range(10)),
+    'queue_order_strategy': 'priority',
+    'visibility_timeout': 3600,  # Redeliver unacked tasks after 1h (acks_late)
+    'health_check_interval': 30,
+    'max_connections': 50,
+}
+CELERY_BROKER_CONNECTION_MAX_RETRIES = 10
+CELERY_RESULT_BACKEND_TRANSPORT_OPTIONS = {
+    'global_keyprefix': 'celery_prod:',
+    'retry_policy': {'timeout': 5.0},
+}
+CELERY_RESULT_EXPIRES = 3600  # Don't let result keys accumulate in Redis
 CELERY_TASK_ACKS_LATE = True
-CELERY_WORKER_PREFETCH_MULTIPLIER = 4
+CELERY_WORKER_PREFETCH_MULTIPLIER = int(os.getenv('CELERY_WORKER_PREFETCH_MULTIPLIER', '1'))  # IO-bound tasks; see base.py
 CELERY_WORKER_MAX_TASKS_PER_CHILD = 1000  # Prevent memory leaks
 CELERY_TASK_TIME_LIMIT = 300  # 5 minutes hard limit
 CELERY_TASK_SOFT_TIME_LIMIT = 240  # 4 minutes soft limit
@@ -189,17 +246,34 @@ CELERY_TASK_SOFT_TIME_LIMIT = 240  # 4 minutes soft limit
 # STATIC FILES - WhiteNoise for serving static files
 # =============================================================================
 
-STATIC_URL = '/static/'
-STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
+# Point STATIC_URL at a CDN origin (e.g. https://cdn.example.com/static/)
+# so WSGI workers never see static requests; filenames are content-
+# hashed, so the CDN can cache them forever. WhiteNoise stays as the
+# origin/fallback server behind the CDN.
+STATIC_URL = os.getenv('STATIC_URL', '/static/')
+STATIC_ROOT = Path(os.getenv('STATIC_ROOT', BASE_DIR / 'staticfiles'))
 STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 
+# WhiteNoise emits .br siblings at collectstatic time when the brotli
+# package is importable (15-25% smaller than the gzip variants);
+# hashed filenames are immutable so clients may cache them for a year
+WHITENOISE_MAX_AGE = 31536000
+WHITENOISE_USE_FINDERS = False
+WHITENOISE_AUTOREFRESH = False
+WHITENOISE_KEEP_ONLY_HASHED_FILES = True  # Skip the unhashed duplicates at collectstatic
+
 # =============================================================================
 # SECURITY SETTINGS - Production Hardening
 # =============================================================================
 
 # SSL/HTTPS Settings
 SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
-SECURE_SSL_REDIRECT = os.getenv('SECURE_SSL_REDIRECT', 'True').lower() == 'true'
+# Default off: the proxy terminating TLS should issue the HTTP->HTTPS
+# redirect (nginx: `return 301 https://$host$request_uri;`) so
+# SecurityMiddleware doesn't inspect the scheme of every request.
+# Set SECURE_SSL_REDIRECT=true only when Django is directly exposed.
+# HSTS below still makes browsers stick to HTTPS either way.
+SECURE_SSL_REDIRECT = envbool('SECURE_SSL_REDIRECT')
 
 # Security Headers
 SECURE_HSTS_SECONDS = 31536000  # 1 year
@@ -224,11 +298,10 @@ if cookie_domain:
     CSRF_COOKIE_DOMAIN = cookie_domain
 
 # CSRF Trusted Origins
-csrf_trusted_origins_env = os.getenv('CSRF_TRUSTED_ORIGINS')
-if csrf_trusted_origins_env:
-    CSRF_TRUSTED_ORIGINS = [origin.strip() for origin in csrf_trusted_origins_env.split(',') if origin.strip()]
-else:
-    CSRF_TRUSTED_ORIGINS = []
+csrf_trusted_origins_env = os.getenv('CSRF_TRUSTED_ORIGINS', '')
+CSRF_TRUSTED_ORIGINS = tuple(
+    origin.strip().lower() for origin in csrf_trusted_origins_env.split(',') if origin.strip()
+)
 
 # =============================================================================
 # LOGGING - Production Monitoring
@@ -260,16 +333,16 @@ LOGGING = {
         },
         'file': {
             'level': 'WARNING',
-            'class': 'logging.handlers.RotatingFileHandler',
-            'filename': os.getenv('LOG_FILE_PATH', os.path.join(BASE_DIR, 'logs', 'production.log')),
+            'class': 'base.log_handlers.AutoDirRotatingFileHandler',
+            'filename': Path(os.getenv('LOG_FILE_PATH', LOGS_DIR / 'production.log')),
             'maxBytes': 1024 * 1024 * 50,  # 50MB
             'backupCount': 10,
             'formatter': 'verbose',
         },
         'error_file': {
             'level': 'ERROR',
-            'class': 'logging.handlers.RotatingFileHandler',
-            'filename': os.getenv('ERROR_LOG_FILE_PATH', os.path.join(BASE_DIR, 'logs', 'error.log')),
+            'class': 'base.log_handlers.AutoDirRotatingFileHandler',
+            'filename': Path(os.getenv('ERROR_LOG_FILE_PATH', LOGS_DIR / 'error.log')),
             'maxBytes': 1024 * 1024 * 50,  # 50MB
             'backupCount': 10,
             'formatter': 'verbose',
@@ -280,47 +353,68 @@ LOGGING = {
             'filters': ['require_debug_false'],
             'formatter': 'verbose',
         },
+        # All records funnel through an in-memory queue; the real handlers
+        # (file rotation, SMTP to admins) run on the QueueListener thread
+        # so disk flushes and rollover renames never block a request.
+        # The handler starts (and atexit-stops) its own listener.
+        'queue': {
+            '()': 'base.log_handlers.QueueListenerHandler',
+            'handlers': [
+                'cfg://handlers.console',
+                'cfg://handlers.file',
+                'cfg://handlers.error_file',
+                'cfg://handlers.mail_admins',
+            ],
+            'respect_handler_level': True,
+        },
     },
     'root': {
-        'handlers': ['console', 'file'],
+        'handlers': ['queue'],
         'level': 'INFO',
     },
     'loggers': {
         'django': {
-            'handlers': ['console', 'file'],
+            'handlers': ['queue'],
             'level': 'INFO',
             'propagate': False,
         },
         'django.request': {
-            'handlers': ['error_file', 'mail_admins'],
+            'handlers': ['queue'],
             'level': 'WARNING',
             'propagate': False,
         },
         'django.security': {
-            'handlers': ['error_file', 'mail_admins'],
+            'handlers': ['queue'],
             'level': 'ERROR',
             'propagate': False,
         },
         'django.db.backends': {
-            'handlers': ['console'],
+            'handlers': ['queue'],
             'level': 'WARNING',
             'propagate': False,
         },
     },
 }
 
-# Create logs directory if it doesn't exist
-LOGS_DIR = os.path.join(BASE_DIR, 'logs')
-os.makedirs(LOGS_DIR, exist_ok=True)
 
 # =============================================================================
 # EMAIL SETTINGS - SMTP for Production
 # =============================================================================
 
-EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+# django.core.mail goes through Celery: callers (notably the
+# AdminEmailHandler during error storms) return after an enqueue
+# instead of holding a thread through TCP+TLS+AUTH to the SMTP host.
+# Workers deliver with the plain SMTP backend below.
+EMAIL_BACKEND = 'djcelery_email.backends.CeleryEmailBackend'
+CELERY_EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+CELERY_EMAIL_TASK_CONFIG = {
+    'queue': 'emails',  # Same queue as apps.email_service tasks
+    'rate_limit': '50/m',
+    'ignore_result': True,
+}
 EMAIL_HOST = os.getenv('EMAIL_HOST', 'smtp.gmail.com')
 EMAIL_PORT = int(os.getenv('EMAIL_PORT', '587'))
-EMAIL_USE_TLS = os.getenv('EMAIL_USE_TLS', 'True') == 'True'
+EMAIL_USE_TLS = envbool('EMAIL_USE_TLS', 'True')
 EMAIL_HOST_USER = os.getenv('EMAIL_HOST_USER', '')
 EMAIL_HOST_PASSWORD = os.getenv('EMAIL_HOST_PASSWORD', '')
 DEFAULT_FROM_EMAIL = os.getenv('DEFAULT_FROM_EMAIL', 'noreply@example.com')
@@ -344,18 +438,31 @@ DATA_UPLOAD_MAX_NUMBER_FIELDS = 1000
 # PERFORMANCE OPTIMIZATIONS
 # =============================================================================
 
-# Template caching
-if not DEBUG:
-    TEMPLATES[0]['APP_DIRS'] = False  # Must be False when using custom loaders
-    TEMPLATES[0]['OPTIONS']['loaders'] = [
-        ('django.template.loaders.cached.Loader', [
-            'django.template.loaders.filesystem.Loader',
-            'django.template.loaders.app_directories.Loader',
-        ]),
-    ]
-
-# Disable template debug mode
-TEMPLATES[0]['OPTIONS']['debug'] = False
+# Template caching: defined in one piece rather than mutating the dict
+# inherited from base.py, so the engine builds its loader chain once at
+# cold start instead of after a post-import rewrite
+TEMPLATES = [
+    {
+        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'DIRS': [BASE_DIR / 'templates'],
+        'APP_DIRS': False,  # Must be False when using custom loaders
+        'OPTIONS': {
+            'context_processors': [
+                'django.template.context_processors.debug',
+                'django.template.context_processors.request',
+                'django.contrib.auth.context_processors.auth',
+                'django.contrib.messages.context_processors.messages',
+            ],
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
+            'debug': False,
+        },
+    },
+]
 
 # =============================================================================
 # UNFOLD ADMIN - Production Configuration
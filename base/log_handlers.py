@@ -0,0 +1,49 @@
+"""
+Custom logging handlers.
+"""
+
+import atexit
+import os
+from logging.config import ConvertingList
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from queue import SimpleQueue
+
+
+class QueueListenerHandler(QueueHandler):
+    """
+    QueueHandler that builds, owns and starts its QueueListener.
+
+    Python 3.12's dictConfig can wire a QueueHandler/QueueListener pair
+    natively, but this project targets 3.11, so the pair is assembled
+    here: records drain into an unbounded queue and the listener thread
+    fans them out to the real handlers (referenced with ``cfg://`` in
+    LOGGING). The listener starts at construction and stops atexit, so
+    no app ``ready()`` hook is needed.
+    """
+
+    def __init__(self, handlers, respect_handler_level=True):
+        super().__init__(SimpleQueue())
+        if isinstance(handlers, ConvertingList):
+            # Indexing forces dictConfig to resolve the cfg:// references
+            handlers = [handlers[i] for i in range(len(handlers))]
+        self.listener = QueueListener(
+            self.queue, *handlers, respect_handler_level=respect_handler_level
+        )
+        self.listener.start()
+        atexit.register(self.listener.stop)
+
+
+class AutoDirRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that creates its log directory on first use.
+
+    Settings modules used to ``os.makedirs`` the logs directory at import
+    time, which ran a stat+mkdir on every management command and worker
+    fork and raised outright on read-only root filesystems. Creating the
+    directory here defers the syscall to handler construction — which,
+    behind the queued logging config, happens once on the listener side.
+    """
+
+    def __init__(self, filename, *args, **kwargs):
+        os.makedirs(os.path.dirname(os.fspath(filename)) or '.', exist_ok=True)
+        super().__init__(filename, *args, **kwargs)
@@ -0,0 +1,91 @@
+"""
+Shared AST parsing for the CRUD generator commands, with a disk cache.
+
+Repeated ``createcrud``/``generatecrud`` runs re-parsed the same
+unchanged models.py every time; parsed trees are cached to
+``~/.cache/django-crud/ast/`` keyed by the source's SHA-256 (plus the
+Python major.minor, so an interpreter upgrade invalidates stale
+pickles automatically).
+"""
+
+import ast
+import hashlib
+import os
+import pickle
+import sys
+from pathlib import Path
+
+from django.core.management.base import CommandError
+
+_CACHE_DIR = (
+    Path(os.getenv('XDG_CACHE_HOME', Path.home() / '.cache')) / 'django-crud' / 'ast'
+)
+
+
+def load_or_parse(models_file):
+    """Return the parsed AST for ``models_file``, reusing a cached tree."""
+    try:
+        source = Path(models_file).read_bytes()
+    except OSError as e:
+        raise CommandError(f"Error parsing models file: {e}")
+
+    version = '%d.%d:' % sys.version_info[:2]
+    key = hashlib.sha256(version.encode() + source).hexdigest()
+    cache_file = _CACHE_DIR / f'{key}.pkl'
+
+    try:
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError):
+        pass  # Miss or corrupt entry; fall through to a fresh parse
+
+    try:
+        # dont_inherit keeps this module's own __future__/compile flags
+        # from leaking into the parse; type comments are off by default,
+        # so the parser stays on its fast path
+        tree = compile(
+            source, str(models_file), 'exec',
+            flags=ast.PyCF_ONLY_AST, dont_inherit=True,
+        )
+    except SyntaxError as e:
+        raise CommandError(f"Error parsing models file: {e}")
+
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp_file, 'wb') as f:
+            pickle.dump(tree, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)  # Atomic: concurrent runs can't tear it
+    except OSError:
+        pass  # Cache is best-effort (read-only home, etc.)
+
+    return tree
+
+
+def _is_model_base(base):
+    """True for a ``models.Model`` or bare ``Model`` base-class node."""
+    if isinstance(base, ast.Attribute):
+        return (
+            isinstance(base.value, ast.Name)
+            and base.value.id == 'models'
+            and base.attr == 'Model'
+        )
+    return isinstance(base, ast.Name) and base.id == 'Model'
+
+
+def extract_models(models_file):
+    """Extract all Django model names from a Python file using AST parsing.
+
+    Returns a list of class names. The generators only ever need the
+    names, so returning them (instead of the ``ast.ClassDef`` nodes)
+    lets the parsed tree be freed as soon as this function returns.
+    Only module-level classes are considered — Django models can't be
+    nested, so there is no reason to walk into function and class bodies.
+    """
+    tree = load_or_parse(models_file)
+
+    return [
+        node.name
+        for node in tree.body
+        if isinstance(node, ast.ClassDef) and any(_is_model_base(b) for b in node.bases)
+    ]
@@ -0,0 +1,418 @@
+"""
+CRUD generation functions shared by createcrud, generatecrud and createapp.
+
+These are plain module-level functions taking the calling command's
+``stdout``/``style`` explicitly, so the commands can share them without
+instantiating each other's ``Command`` classes (which re-initializes
+argparse state and used to require monkey-patching stdout across
+instances).
+"""
+
+import ast
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from base.management.commands import _templates
+from base.management.commands._ast_cache import load_or_parse
+
+
+def _append_to_list_literal(content, list_name, entry, tree=None):
+    """
+    Insert ``entry`` as the last element of the module-level list literal
+    assigned to ``list_name``, returning the new source (or None if the
+    assignment wasn't found).
+
+    The list is located by parsing the module once with ``ast``, so nested
+    brackets (e.g. ``include([...])`` inside urlpatterns) are handled
+    correctly and nothing is regex-scanned. Callers that already hold the
+    file's parsed tree (e.g. from the disk AST cache) can pass it in.
+    """
+    if tree is None:
+        try:
+            tree = ast.parse(content)
+        except SyntaxError:
+            return None
+
+    for node in tree.body:
+        if not isinstance(node, ast.Assign):
+            continue
+        if not any(isinstance(t, ast.Name) and t.id == list_name for t in node.targets):
+            continue
+        if not isinstance(node.value, ast.List):
+            continue
+
+        # Offset of the list's closing bracket in the source
+        lines = content.splitlines(keepends=True)
+        end = sum(len(line) for line in lines[:node.value.end_lineno - 1])
+        end += node.value.end_col_offset - 1
+        if end >= len(content) or content[end] != ']':
+            # Position didn't land on the closing bracket (mixed line
+            # endings, stale file) — refuse rather than corrupt the file
+            return None
+
+        body = content[:end].rstrip()
+        if body.endswith('['):
+            insertion = f'\n    {entry},\n'
+        else:
+            insertion = f'\n    {entry},\n' if body.endswith(',') else f',\n    {entry},\n'
+        return body + insertion + content[end:]
+
+    return None
+
+
+def _write_if_changed(path, content):
+    """Write ``content`` to ``path`` only when it differs from what's there.
+
+    Regenerating with --overwrite rewrites every file even when nothing
+    changed, churning mtimes (and with them dev-server reloads and build
+    caches) and paying open+write+close per file on slow bind mounts.
+    """
+    data = content.encode()
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    path.write_bytes(data)
+    return True
+
+
+def _report(stdout, style, generated, skipped):
+    """Emit one summary line per batch of generated/skipped files."""
+    if generated:
+        stdout.write(style.SUCCESS(
+            '\n'.join(f'✅ Generated: {name}' for name in generated)
+        ))
+    if skipped:
+        stdout.write(style.WARNING(
+            '\n'.join(f'⚠️  Skipping {name}' for name in skipped)
+        ))
+
+
+def create_directories(app_dir):
+    """Create necessary directories for the app structure."""
+    directories = ['serializers', 'views', 'services']
+    for dir_name in directories:
+        dir_path = app_dir / dir_name
+        os.makedirs(dir_path, exist_ok=True)
+        init_file = dir_path / '__init__.py'
+        if not init_file.exists():
+            init_file.touch()
+
+
+def _generate_single_file(stdout, style, target, header, cls_tmpl, app_name,
+                          model_names, overwrite):
+    """Render every model's class into one flat module at ``target``.
+
+    Used by --single-file mode: one serializers.py/views.py/services.py
+    instead of a package with one module per model, cutting both the
+    generation-time writes and the per-module import cost at runtime
+    (each extra module is a separate find_spec + exec_module).
+    """
+    if target.exists() and not overwrite:
+        stdout.write(style.WARNING(f'⚠️  Skipping {target.name}'))
+        return
+
+    package_dir = target.with_suffix('')
+    if package_dir.is_dir():
+        # A leftover per-model package would shadow the flat module on
+        # import; warn instead of silently generating dead code
+        stdout.write(style.WARNING(
+            f'⚠️  {package_dir.name}/ package exists and takes import '
+            f'precedence over {target.name}; remove it or rerun without '
+            f'--single-file'
+        ))
+
+    content = header + '\n\n'.join(
+        cls_tmpl.format(
+            model_name=m, app_name=app_name, model_lower=m.lower()
+        )
+        for m in model_names
+    )
+    _write_if_changed(target, content)
+    stdout.write(style.SUCCESS(f'✅ Generated: {target.name}'))
+
+
+def generate_serializers(stdout, style, app_dir, app_name, model_names, overwrite,
+                         single_file=False):
+    """Generate serializer files (one per model, or one flat module)."""
+    if single_file:
+        header = _templates.SERIALIZERS_MODULE_HEADER.format(
+            app_name=app_name,
+            import_lines=''.join(f'    {m},\n' for m in model_names),
+        )
+        _generate_single_file(
+            stdout, style, app_dir / 'serializers.py', header,
+            _templates.SERIALIZER_CLS_TMPL, app_name, model_names, overwrite,
+        )
+        return
+
+    serializers_dir = app_dir / 'serializers'
+
+    # One summary write per generator instead of a styled (and
+    # flushed) stdout line per model
+    generated, skipped = [], []
+    for model_name in model_names:
+        serializer_file = serializers_dir / f'{model_name.lower()}_serializer.py'
+
+        if serializer_file.exists() and not overwrite:
+            skipped.append(serializer_file.name)
+            continue
+
+        content = _templates.SERIALIZER_TMPL.format(
+            model_name=model_name, app_name=app_name
+        )
+        _write_if_changed(serializer_file, content)
+        generated.append(f'serializers/{serializer_file.name}')
+    _report(stdout, style, generated, skipped)
+
+    # Update __init__.py
+    init_file = serializers_dir / '__init__.py'
+    init_content = _templates.render_init(
+        'Auto-generated serializers.', model_names, 'serializer', 'Serializer'
+    )
+    _write_if_changed(init_file, init_content)
+
+
+def generate_viewsets(stdout, style, app_dir, app_name, model_names, overwrite,
+                      single_file=False):
+    """Generate viewset files (one per model, or one flat module)."""
+    if single_file:
+        header = _templates.VIEWS_MODULE_HEADER.format(
+            app_name=app_name,
+            import_lines=''.join(f'    {m},\n' for m in model_names),
+            serializer_imports=''.join(f'    {m}Serializer,\n' for m in model_names),
+            service_imports=''.join(f'    {m}Service,\n' for m in model_names),
+        )
+        _generate_single_file(
+            stdout, style, app_dir / 'views.py', header,
+            _templates.VIEWSET_CLS_TMPL, app_name, model_names, overwrite,
+        )
+        return
+
+    views_dir = app_dir / 'views'
+
+    generated, skipped = [], []
+    for model_name in model_names:
+        viewset_file = views_dir / f'{model_name.lower()}_viewset.py'
+
+        if viewset_file.exists() and not overwrite:
+            skipped.append(viewset_file.name)
+            continue
+
+        content = _templates.VIEWSET_TMPL.format(
+            model_name=model_name, app_name=app_name, model_lower=model_name.lower()
+        )
+        _write_if_changed(viewset_file, content)
+        generated.append(f'views/{viewset_file.name}')
+    _report(stdout, style, generated, skipped)
+
+    # Update __init__.py
+    init_file = views_dir / '__init__.py'
+    init_content = _templates.render_init(
+        'Auto-generated viewsets.', model_names, 'viewset', 'ViewSet'
+    )
+    _write_if_changed(init_file, init_content)
+
+
+def generate_services(stdout, style, app_dir, app_name, model_names, overwrite,
+                      single_file=False):
+    """Generate service files (one per model, or one flat module)."""
+    if single_file:
+        header = _templates.SERVICES_MODULE_HEADER.format(
+            app_name=app_name,
+            import_lines=''.join(f'    {m},\n' for m in model_names),
+        )
+        _generate_single_file(
+            stdout, style, app_dir / 'services.py', header,
+            _templates.SERVICE_CLS_TMPL, app_name, model_names, overwrite,
+        )
+        return
+
+    services_dir = app_dir / 'services'
+
+    generated, skipped = [], []
+    for model_name in model_names:
+        service_file = services_dir / f'{model_name.lower()}_service.py'
+
+        if service_file.exists() and not overwrite:
+            skipped.append(service_file.name)
+            continue
+
+        content = _templates.SERVICE_TMPL.format(
+            model_name=model_name, app_name=app_name
+        )
+        _write_if_changed(service_file, content)
+        generated.append(f'services/{service_file.name}')
+    _report(stdout, style, generated, skipped)
+
+    # Update __init__.py
+    init_file = services_dir / '__init__.py'
+    init_content = _templates.render_init(
+        'Auto-generated services.', model_names, 'service', 'Service'
+    )
+    _write_if_changed(init_file, init_content)
+
+
+def generate_urls(stdout, style, app_dir, app_name, model_names, overwrite):
+    """Generate URL routes for all viewsets."""
+    urls_file = app_dir / 'urls.py'
+
+    if urls_file.exists() and not overwrite:
+        stdout.write(style.WARNING(f'⚠️  Skipping urls.py'))
+        return
+
+    content = _templates.URLS_TMPL.format(
+        app_name=app_name,
+        import_lines=''.join(
+            f'    {m}ViewSet,\n' for m in model_names
+        ),
+        register_lines=''.join(
+            f"router.register(r'{m.lower()}s', {m}ViewSet, basename='{m.lower()}')\n"
+            for m in model_names
+        ),
+    )
+    _write_if_changed(urls_file, content)
+    stdout.write(style.SUCCESS(f'✅ Generated: urls.py'))
+
+
+def generate_admin(stdout, style, app_dir, app_name, model_names, overwrite):
+    """Generate admin.py with Unfold admin interface."""
+    admin_file = app_dir / 'admin.py'
+
+    if admin_file.exists() and not overwrite:
+        stdout.write(style.WARNING(f'⚠️  Skipping admin.py'))
+        return
+
+    header = _templates.ADMIN_HEADER_TMPL.format(
+        app_name=app_name,
+        import_lines=''.join(f'    {m},\n' for m in model_names),
+    )
+    content = header + ''.join(
+        _templates.ADMIN_CLASS_TMPL.format(model_name=m) for m in model_names
+    )
+    _write_if_changed(admin_file, content)
+    stdout.write(style.SUCCESS(f'✅ Generated: admin.py'))
+
+
+def create_apps_config(stdout, style, app_dir, app_name, overwrite):
+    """Create apps.py configuration file."""
+    apps_file = app_dir / 'apps.py'
+
+    if apps_file.exists() and not overwrite:
+        return
+
+    content = _templates.APPS_TMPL.format(
+        config_name=app_name.capitalize(), app_name=app_name
+    )
+    _write_if_changed(apps_file, content)
+    stdout.write(style.SUCCESS(f'✅ Generated: apps.py'))
+
+
+class _StdoutBuffer:
+    """Collects a worker thread's output lines for later replay.
+
+    Giving each pooled generator its own buffer keeps concurrent runs
+    from interleaving their summaries; the caller replays the buffers in
+    submission order, so the output matches the sequential version.
+    """
+
+    def __init__(self):
+        self.lines = []
+
+    def write(self, msg, *args, **kwargs):
+        self.lines.append(msg)
+
+
+def run_generators(stdout, style, app_dir, app_name, model_names, overwrite,
+                   single_file=False):
+    """Run the five file generators concurrently on a small thread pool.
+
+    They are independent — disjoint output paths, no shared mutable
+    state — and each is dominated by file I/O, so overlapping them
+    shortens generation on many-model apps without reordering output.
+    """
+    tasks = [
+        (generate_serializers, (app_dir, app_name, model_names, overwrite, single_file)),
+        (generate_viewsets, (app_dir, app_name, model_names, overwrite, single_file)),
+        (generate_services, (app_dir, app_name, model_names, overwrite, single_file)),
+        (generate_urls, (app_dir, app_name, model_names, overwrite)),
+        (generate_admin, (app_dir, app_name, model_names, overwrite)),
+    ]
+    buffers = [_StdoutBuffer() for _ in tasks]
+    with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+        futures = [
+            executor.submit(func, buffer, style, *args)
+            for (func, args), buffer in zip(tasks, buffers)
+        ]
+        for future in futures:
+            future.result()  # Surface worker exceptions to the command
+    for buffer in buffers:
+        for msg in buffer.lines:
+            stdout.write(msg)
+
+
+def add_to_installed_apps(stdout, style, app_name):
+    """Automatically add app to INSTALLED_APPS in settings."""
+    settings_file = Path('base/core/base.py')
+
+    if not settings_file.exists():
+        stdout.write(style.WARNING('⚠️  Could not find base/core/base.py'))
+        return
+
+    content = settings_file.read_text()
+    app_entry = f"'apps.{app_name}'"
+
+    # Check if already added
+    if app_entry in content:
+        stdout.write(style.WARNING(f'⚠️  App already in INSTALLED_APPS'))
+        return
+
+    # The disk AST cache makes repeated bootstrap runs skip re-parsing
+    # the (largish) settings module
+    new_content = _append_to_list_literal(
+        content, 'LOCAL_APPS', app_entry, tree=load_or_parse(settings_file)
+    )
+    if new_content is None:
+        stdout.write(style.WARNING(
+            f'⚠️  Could not find LOCAL_APPS in {settings_file}; add {app_entry} manually.'
+        ))
+        return
+    _write_if_changed(settings_file, new_content)
+
+
+def add_to_main_urls(stdout, style, app_name):
+    """Automatically add app URLs to main urls.py."""
+    urls_file = Path('base/urls.py')
+
+    if not urls_file.exists():
+        stdout.write(style.WARNING('⚠️  Could not find base/urls.py'))
+        return
+
+    content = urls_file.read_text()
+    url_pattern = f"path('api/{app_name}/', include('apps.{app_name}.urls'))"
+
+    # Check if already added
+    if f"api/{app_name}/" in content:
+        stdout.write(style.WARNING(f'⚠️  URLs already added'))
+        return
+
+    # Ensure 'include' is imported
+    if 'from django.urls import' in content and 'include' not in content:
+        content = content.replace(
+            'from django.urls import path',
+            'from django.urls import path, include'
+        )
+
+    new_content = _append_to_list_literal(
+        content, 'urlpatterns', url_pattern,
+        # Only reuse the cached tree when no import fixup touched content
+        tree=None if content != urls_file.read_text() else load_or_parse(urls_file),
+    )
+    if new_content is None:
+        stdout.write(style.WARNING(
+            f'⚠️  Could not find urlpatterns in {urls_file}; add the route manually.'
+        ))
+        return
+    _write_if_changed(urls_file, new_content)
@@ -0,0 +1,247 @@
+"""
+Source templates for the CRUD generator commands.
+
+Each constant is a ``str.format`` template parsed once at import; the
+generators render them per model instead of re-building the file bodies
+with inline f-string concatenation. Literal braces in generated code
+(e.g. ``{id}`` in docstrings, admin fieldset dicts) are doubled.
+"""
+
+SERIALIZER_CLS_TMPL = '''class {model_name}Serializer(serializers.ModelSerializer):
+    """Serializer for {model_name} model with full CRUD support."""
+
+    class Meta:
+        model = {model_name}
+        fields = '__all__'
+        read_only_fields = ['id', 'created_at', 'updated_at']
+'''
+
+SERIALIZER_TMPL = '''"""Serializer for {model_name} model."""
+
+from rest_framework import serializers
+from apps.{app_name}.models import {model_name}
+
+
+''' + SERIALIZER_CLS_TMPL
+
+# Header for --single-file mode: one serializers.py importing every model
+SERIALIZERS_MODULE_HEADER = '''"""Serializers for {app_name} app."""
+
+from rest_framework import serializers
+from apps.{app_name}.models import (
+{import_lines})
+
+
+'''
+
+VIEWSET_CLS_TMPL = '''class {model_name}ViewSet(DynamicThrottleMixin, viewsets.ModelViewSet):
+    """
+    ViewSet for {model_name} with full CRUD operations.
+
+    Rate Limiting:
+    - Read operations (GET): 100/minute
+    - Write operations (POST/PUT/PATCH): 50/minute
+    - Create operations (POST): 30/minute
+    - Delete operations (DELETE): 20/minute
+    - Burst protection: 10/second
+    - Daily limit: 1000/day
+
+    Endpoints:
+    - GET    /api/{app_name}/{model_lower}s/     - List all
+    - POST   /api/{app_name}/{model_lower}s/     - Create new
+    - GET    /api/{app_name}/{model_lower}s/{{id}}/ - Retrieve one
+    - PUT    /api/{app_name}/{model_lower}s/{{id}}/ - Update (full)
+    - PATCH  /api/{app_name}/{model_lower}s/{{id}}/ - Update (partial)
+    - DELETE /api/{app_name}/{model_lower}s/{{id}}/ - Delete
+    """
+    queryset = {model_name}.objects.all()
+    serializer_class = {model_name}Serializer
+    permission_classes = [IsAuthenticated]
+    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+
+    # Rate limiting is automatically applied via DynamicThrottleMixin
+    # To customize, override get_throttles() or set throttle_classes directly
+
+    # Uncomment and customize as needed:
+    # filterset_fields = ['field1', 'field2']
+    # search_fields = ['field1', 'field2']
+    # ordering_fields = ['created_at', 'updated_at']
+    # ordering = ['-created_at']
+
+    def get_queryset(self):
+        """Override to add custom filtering."""
+        return {model_name}Service.get_all()
+
+    def perform_create(self, serializer):
+        """Use service layer for creation."""
+        {model_name}Service.create(serializer.validated_data)
+
+    def perform_update(self, serializer):
+        """Use service layer for updates."""
+        {model_name}Service.update(serializer.instance, serializer.validated_data)
+
+    def perform_destroy(self, instance):
+        """Use service layer for deletion."""
+        {model_name}Service.delete(instance)
+'''
+
+VIEWSET_TMPL = '''"""ViewSet for {model_name} model."""
+
+from rest_framework import viewsets, filters
+from rest_framework.permissions import IsAuthenticated
+from django_filters.rest_framework import DjangoFilterBackend
+
+from apps.{app_name}.models import {model_name}
+from apps.{app_name}.serializers import {model_name}Serializer
+from apps.{app_name}.services.{model_lower}_service import {model_name}Service
+from base.throttles import DynamicThrottleMixin
+
+
+''' + VIEWSET_CLS_TMPL
+
+# In --single-file mode services.py is a flat module, so the services
+# import loses its per-model submodule path
+VIEWS_MODULE_HEADER = '''"""ViewSets for {app_name} app."""
+
+from rest_framework import viewsets, filters
+from rest_framework.permissions import IsAuthenticated
+from django_filters.rest_framework import DjangoFilterBackend
+
+from apps.{app_name}.models import (
+{import_lines})
+from apps.{app_name}.serializers import (
+{serializer_imports})
+from apps.{app_name}.services import (
+{service_imports})
+from base.throttles import DynamicThrottleMixin
+
+
+'''
+
+SERVICE_CLS_TMPL = '''class {model_name}Service:
+    """Business logic for {model_name}."""
+
+    @staticmethod
+    def get_all():
+        """Get all {model_name} instances."""
+        return {model_name}.objects.all()
+
+    @staticmethod
+    def get_by_id(id):
+        """Get {model_name} by ID."""
+        return {model_name}.objects.filter(id=id).first()
+
+    @staticmethod
+    @transaction.atomic
+    def create(data):
+        """Create a new {model_name}."""
+        return {model_name}.objects.create(**data)
+
+    @staticmethod
+    @transaction.atomic
+    def update(instance, data):
+        """Update an existing {model_name}."""
+        for key, value in data.items():
+            setattr(instance, key, value)
+        instance.save()
+        return instance
+
+    @staticmethod
+    @transaction.atomic
+    def delete(instance):
+        """Delete a {model_name}."""
+        instance.delete()
+'''
+
+SERVICE_TMPL = '''"""Service layer for {model_name} model."""
+
+from django.db import transaction
+from apps.{app_name}.models import {model_name}
+
+
+''' + SERVICE_CLS_TMPL
+
+SERVICES_MODULE_HEADER = '''"""Service layer for {app_name} app."""
+
+from django.db import transaction
+from apps.{app_name}.models import (
+{import_lines})
+
+
+'''
+
+URLS_TMPL = '''"""URL routes for {app_name} app."""
+
+from django.urls import path, include
+from rest_framework.routers import DefaultRouter
+from apps.{app_name}.views import (
+{import_lines})\n
+router = DefaultRouter()
+{register_lines}
+app_name = '{app_name}'
+
+urlpatterns = [
+    path('', include(router.urls)),
+]
+'''
+
+ADMIN_HEADER_TMPL = '''"""Admin configuration for {app_name} app with Unfold interface."""
+
+from django.contrib import admin
+from unfold.admin import ModelAdmin
+from apps.{app_name}.models import (
+{import_lines})
+
+'''
+
+ADMIN_CLASS_TMPL = '''
+@admin.register({model_name})
+class {model_name}Admin(ModelAdmin):
+    """Admin interface for {model_name} model."""
+
+    # Customize these fields based on your model
+    list_display = ['id', 'created_at']  # Add your model fields here
+    list_filter = ['created_at']
+    search_fields = ['id']  # Add searchable fields here
+    ordering = ['-created_at']
+
+    # Unfold-specific configurations
+    # list_display_links = ['id']
+    # list_per_page = 25
+    # date_hierarchy = 'created_at'
+
+    # Customize fieldsets for better organization
+    # fieldsets = (
+    #     ('Basic Information', {{
+    #         'fields': ('field1', 'field2')
+    #     }}),
+    #     ('Timestamps', {{
+    #         'fields': ('created_at', 'updated_at'),
+    #         'classes': ('collapse',)
+    #     }}),
+    # )
+
+    # Read-only fields
+    # readonly_fields = ['created_at', 'updated_at']
+
+'''
+
+APPS_TMPL = '''from django.apps import AppConfig
+
+
+class {config_name}Config(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.{app_name}'
+    label = '{app_name}'
+'''
+
+
+def render_init(docstring, model_names, suffix, cls_suffix):
+    """Render a package __init__.py re-exporting one class per model."""
+    parts = [f'"""{docstring}"""\n\n']
+    parts.extend(f'from .{name.lower()}_{suffix} import {name}{cls_suffix}\n'
+                 for name in model_names)
+    parts.append('\n__all__ = [\n')
+    parts.extend(f"    '{name}{cls_suffix}',\n" for name in model_names)
+    parts.append(']\n')
+    return ''.join(parts)
@@ -13,11 +13,24 @@ This interactive command will:
 """
 
 import os
-import re
 from pathlib import Path
 from django.core.management.base import BaseCommand, CommandError
 
 
+# Menu of supported field types; built once at import rather than per prompt
+FIELD_TYPES = {
+    '1': ('CharField', 'max_length=255'),
+    '2': ('TextField', ''),
+    '3': ('IntegerField', ''),
+    '4': ('BooleanField', 'default=True'),
+    '5': ('DateTimeField', 'auto_now_add=True'),
+    '6': ('DateField', ''),
+    '7': ('EmailField', ''),
+    '8': ('DecimalField', 'max_digits=10, decimal_places=2'),
+    '9': ('ForeignKey', ''),
+}
+
+
 class Command(BaseCommand):
     help = 'Interactive app generator with CRUD APIs'
 
@@ -34,7 +47,13 @@ class Command(BaseCommand):
         )
 
     def handle(self, *args, **options):
-        self.stdout.write(self.style.SUCCESS('\n🚀 Django App Generator with Auto-CRUD\n'))
+        # Bind the style callables once; the wizard applies them
+        # hundreds of times across an interactive session
+        self.ok = self.style.SUCCESS
+        self.warn = self.style.WARNING
+        self.err = self.style.ERROR
+
+        self.stdout.write(self.ok('\n🚀 Django App Generator with Auto-CRUD\n'))
         
         # Get app name
         app_name = options.get('app_name')
@@ -49,12 +68,12 @@ class Command(BaseCommand):
         if app_dir.exists():
             overwrite = self.get_yes_no(f'App "{app_name}" already exists. Overwrite?')
             if not overwrite:
-                self.stdout.write(self.style.WARNING('Aborted.'))
+                self.stdout.write(self.warn('Aborted.'))
                 return
         
         # Create app directory
         app_dir.mkdir(parents=True, exist_ok=True)
-        self.stdout.write(self.style.SUCCESS(f'✅ Created app directory: apps/{app_name}/'))
+        self.stdout.write(self.ok(f'✅ Created app directory: apps/{app_name}/'))
         
         # Create __init__.py
         (app_dir / '__init__.py').touch()
@@ -80,7 +99,7 @@ class Command(BaseCommand):
 
 # Create your models here.
 ''')
-            self.stdout.write(self.style.SUCCESS('✅ Created empty models.py'))
+            self.stdout.write(self.ok('✅ Created empty models.py'))
         
         # Add to INSTALLED_APPS
         self.add_to_installed_apps(app_name)
@@ -90,7 +109,7 @@ class Command(BaseCommand):
             self.add_to_main_urls(app_name)
         
         # Final instructions
-        self.stdout.write(self.style.SUCCESS('\n✨ App created successfully!'))
+        self.stdout.write(self.ok('\n✨ App created successfully!'))
         self.stdout.write('\n📝 Next steps:')
         if create_models and models:
             self.stdout.write(f'   1. Run migrations: python manage.py makemigrations {app_name}')
@@ -103,19 +122,19 @@ class Command(BaseCommand):
 
     def get_input(self, prompt):
         """Get user input."""
-        return input(self.style.WARNING(prompt)).strip()
+        return input(self.warn(prompt)).strip()
 
     def get_yes_no(self, prompt, default=False):
         """Get yes/no input from user."""
         default_str = 'Y/n' if default else 'y/N'
-        response = input(self.style.WARNING(f'{prompt} [{default_str}]: ')).strip().lower()
+        response = input(self.warn(f'{prompt} [{default_str}]: ')).strip().lower()
         if not response:
             return default
         return response in ['y', 'yes']
 
     def create_models_interactively(self, app_dir, app_name):
         """Guide user through creating models."""
-        self.stdout.write(self.style.SUCCESS('\n📋 Model Creation Wizard'))
+        self.stdout.write(self.ok('\n📋 Model Creation Wizard'))
         self.stdout.write('You can create multiple models. Press Enter without a name to finish.\n')
         
         models = []
@@ -128,7 +147,7 @@ class Command(BaseCommand):
                 model_name = model_name.capitalize()
             
             if not model_name.isidentifier():
-                self.stdout.write(self.style.ERROR('Invalid model name. Use only letters and numbers.'))
+                self.stdout.write(self.err('Invalid model name. Use only letters and numbers.'))
                 continue
             
             self.stdout.write(f'\n🔧 Creating model: {model_name}')
@@ -139,10 +158,10 @@ class Command(BaseCommand):
                 'fields': fields
             })
             
-            self.stdout.write(self.style.SUCCESS(f'✅ Model "{model_name}" configured\n'))
+            self.stdout.write(self.ok(f'✅ Model "{model_name}" configured\n'))
         
         if not models:
-            self.stdout.write(self.style.WARNING('No models created.'))
+            self.stdout.write(self.warn('No models created.'))
             return None
         
         # Generate models.py
@@ -155,17 +174,6 @@ class Command(BaseCommand):
         self.stdout.write('Press Enter without a field name to finish.\n')
         
         fields = []
-        field_types = {
-            '1': ('CharField', 'max_length=255'),
-            '2': ('TextField', ''),
-            '3': ('IntegerField', ''),
-            '4': ('BooleanField', 'default=True'),
-            '5': ('DateTimeField', 'auto_now_add=True'),
-            '6': ('DateField', ''),
-            '7': ('EmailField', ''),
-            '8': ('DecimalField', 'max_digits=10, decimal_places=2'),
-            '9': ('ForeignKey', ''),
-        }
         
         while True:
             field_name = self.get_input('  Field name (or Enter to finish): ')
@@ -173,7 +181,7 @@ class Command(BaseCommand):
                 break
             
             if not field_name.isidentifier():
-                self.stdout.write(self.style.ERROR('  Invalid field name.'))
+                self.stdout.write(self.err('  Invalid field name.'))
                 continue
             
             self.stdout.write('  Field type:')
@@ -188,11 +196,11 @@ class Command(BaseCommand):
             self.stdout.write('    9. ForeignKey (relation)')
             
             choice = self.get_input('  Choose (1-9): ')
-            if choice not in field_types:
-                self.stdout.write(self.style.ERROR('  Invalid choice.'))
+            if choice not in FIELD_TYPES:
+                self.stdout.write(self.err('  Invalid choice.'))
                 continue
             
-            field_type, default_params = field_types[choice]
+            field_type, default_params = FIELD_TYPES[choice]
             
             # Ask for additional options
             nullable = self.get_yes_no('  Allow null/blank?', default=False)
@@ -209,67 +217,70 @@ class Command(BaseCommand):
                 'params': ', '.join(params) if params else ''
             })
             
-            self.stdout.write(self.style.SUCCESS(f'  ✅ Added: {field_name}\n'))
+            self.stdout.write(self.ok(f'  ✅ Added: {field_name}\n'))
         
         return fields
 
     def write_models_file(self, app_dir, app_name, models):
         """Write models.py file."""
-        content = 'from django.db import models\n\n\n'
-        
+        # Accumulate in a list and join once; repeated str += is O(n^2)
+        parts = ['from django.db import models\n\n\n']
+
         for model in models:
-            content += f'class {model["name"]}(models.Model):\n'
-            content += f'    """Model for {model["name"]}."""\n\n'
-            
+            parts.append(f'class {model["name"]}(models.Model):\n')
+            parts.append(f'    """Model for {model["name"]}."""\n\n')
+
             # Add fields
             for field in model['fields']:
                 params = f'({field["params"]})' if field['params'] else '()'
-                content += f'    {field["name"]} = models.{field["type"]}{params}\n'
-            
+                parts.append(f'    {field["name"]} = models.{field["type"]}{params}\n')
+
             # Add timestamps
-            content += '    created_at = models.DateTimeField(auto_now_add=True)\n'
-            content += '    updated_at = models.DateTimeField(auto_now=True)\n\n'
-            
+            parts.append('    created_at = models.DateTimeField(auto_now_add=True)\n')
+            parts.append('    updated_at = models.DateTimeField(auto_now=True)\n\n')
+
             # Add Meta
-            content += '    class Meta:\n'
-            content += f'        db_table = \'{app_name}_{model["name"].lower()}\'\n'
-            content += '        ordering = [\'-created_at\']\n\n'
-            
+            parts.append('    class Meta:\n')
+            parts.append(f'        db_table = \'{app_name}_{model["name"].lower()}\'\n')
+            parts.append('        ordering = [\'-created_at\']\n\n')
+
             # Add __str__
             first_field = model['fields'][0]['name'] if model['fields'] else 'id'
-            content += '    def __str__(self):\n'
-            content += f'        return str(self.{first_field})\n\n\n'
-        
+            parts.append('    def __str__(self):\n')
+            parts.append(f'        return str(self.{first_field})\n\n\n')
+
+        from base.management.commands._crud_gen import _write_if_changed
+
         models_file = app_dir / 'models.py'
-        models_file.write_text(content)
-        self.stdout.write(self.style.SUCCESS(f'✅ Created models.py with {len(models)} model(s)'))
+        _write_if_changed(models_file, ''.join(parts))
+        self.stdout.write(self.ok(f'✅ Created models.py with {len(models)} model(s)'))
 
     def generate_crud(self, app_dir, app_name, models):
         """Generate CRUD files."""
-        self.stdout.write(self.style.SUCCESS('\n🔧 Generating CRUD APIs...'))
-        
-        # Import the generation functions from createcrud command
-        from base.management.commands.createcrud import Command as CrudCommand
-        
-        crud_cmd = CrudCommand()
-        
+        self.stdout.write(self.ok('\n🔧 Generating CRUD APIs...'))
+
+        from base.management.commands import _crud_gen
+
         # Extract model names
-        model_classes = {model['name']: None for model in models}
-        
+        model_names = [model['name'] for model in models]
+
+        # Interactive apps are small; fuse each layer into one module
+        # unless the wizard produced an unusually large model set
+        single_file = len(model_names) <= 8
+
         # Create directories
-        crud_cmd.create_directories(app_dir)
-        
-        # Generate files
-        crud_cmd.generate_serializers(app_dir, app_name, model_classes, overwrite=True)
-        crud_cmd.generate_viewsets(app_dir, app_name, model_classes, overwrite=True)
-        crud_cmd.generate_services(app_dir, app_name, model_classes, overwrite=True)
-        crud_cmd.generate_urls(app_dir, app_name, model_classes, overwrite=True)
-        crud_cmd.generate_admin(app_dir, app_name, model_classes, overwrite=True)
+        if not single_file:
+            _crud_gen.create_directories(app_dir)
+
+        # Generate files concurrently; the generators touch disjoint paths
+        _crud_gen.run_generators(self.stdout, self.style, app_dir, app_name, model_names, True, single_file)
 
     def create_apps_config(self, app_dir, app_name):
         """Create apps.py configuration file."""
+        from base.management.commands._crud_gen import _write_if_changed
+
         apps_file = app_dir / 'apps.py'
-        
+
         content = f'''from django.apps import AppConfig
 
 
@@ -278,8 +289,8 @@ class {app_name.capitalize()}Config(AppConfig):
     name = 'apps.{app_name}'
     label = '{app_name}'
 '''
-        apps_file.write_text(content)
-        self.stdout.write(self.style.SUCCESS(f'✅ Created apps.py'))
+        _write_if_changed(apps_file, content)
+        self.stdout.write(self.ok(f'✅ Created apps.py'))
 
     def add_to_installed_apps(self, app_name):
         """Automatically add app to INSTALLED_APPS in settings."""
@@ -294,21 +305,17 @@ class {app_name.capitalize()}Config(AppConfig):
         if app_entry in content:
             return
 
-        pattern = r"(LOCAL_APPS\s*=\s*\[)([^\]]*)(])"
-        
-        def add_app(match):
-            start = match.group(1)
-            apps = match.group(2)
-            end = match.group(3)
-            
-            if apps.strip():
-                return f"{start}{apps}\n    {app_entry},\n{end}"
-            else:
-                return f"{start}\n    {app_entry},\n{end}"
-        
-        new_content = re.sub(pattern, add_app, content, flags=re.DOTALL)
+        from base.management.commands._crud_gen import _append_to_list_literal, _write_if_changed
+
+        new_content = _append_to_list_literal(content, 'LOCAL_APPS', app_entry)
+        if new_content is None:
+            self.stdout.write(self.warn(
+                f'⚠️  Could not find LOCAL_APPS in {settings_file}; add {app_entry} manually.'
+            ))
+            return
+
         settings_file.write_text(new_content)
-        self.stdout.write(self.style.SUCCESS('✅ Added to INSTALLED_APPS'))
+        self.stdout.write(self.ok('✅ Added to INSTALLED_APPS'))
 
     def add_to_main_urls(self, app_name):
         """Automatically add app URLs to main urls.py."""
@@ -329,15 +336,14 @@ class {app_name.capitalize()}Config(AppConfig):
                 'from django.urls import path, include'
             )
 
-        pattern = r"(urlpatterns\s*=\s*\[)([^\]]*)(])"
-        
-        def add_url(match):
-            start = match.group(1)
-            patterns = match.group(2)
-            end = match.group(3)
-            
-            return f"{start}{patterns}\n    {url_pattern},\n{end}"
-        
-        new_content = re.sub(pattern, add_url, content, flags=re.DOTALL)
+        from base.management.commands._crud_gen import _append_to_list_literal, _write_if_changed
+
+        new_content = _append_to_list_literal(content, 'urlpatterns', url_pattern)
+        if new_content is None:
+            self.stdout.write(self.warn(
+                f'⚠️  Could not find urlpatterns in {urls_file}; add the route manually.'
+            ))
+            return
+
         urls_file.write_text(new_content)
-        self.stdout.write(self.style.SUCCESS('✅ Added to main urls.py'))
+        self.stdout.write(self.ok('✅ Added to main urls.py'))
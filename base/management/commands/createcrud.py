@@ -17,7 +17,6 @@ Note: All generated views use class-based structure (ViewSets) for consistency.
 """
 
 import os
-import re
 from pathlib import Path
 from django.core.management.base import BaseCommand, CommandError
 
@@ -41,8 +40,28 @@ class Command(BaseCommand):
             action='store_true',
             help='Overwrite existing files'
         )
+        parser.add_argument(
+            '--single-file',
+            action='store_true',
+            dest='single_file',
+            default=None,
+            help='Emit one serializers.py/views.py/services.py instead of '
+                 'per-model packages (default for 8 models or fewer)'
+        )
+        parser.add_argument(
+            '--multi-file',
+            action='store_false',
+            dest='single_file',
+            help='Force one file per model even for small apps'
+        )
 
     def handle(self, *args, **options):
+        # Imported here rather than at module scope: manage.py imports
+        # every commands/*.py during discovery, and unrelated commands
+        # shouldn't pay for the generator machinery
+        from base.management.commands import _crud_gen
+        from base.management.commands._ast_cache import extract_models
+
         app_name = options['app_name']
         models_file = options['models_file']
         overwrite = options['overwrite']
@@ -55,13 +74,13 @@ class Command(BaseCommand):
         self.stdout.write(f'📁 Models file: {models_file}\n')
 
         # Extract models from the file
-        model_classes = self.extract_models(models_file)
-        
-        if not model_classes:
+        model_names = extract_models(models_file)
+
+        if not model_names:
             raise CommandError(f"No Django models found in '{models_file}'")
 
-        self.stdout.write(self.style.SUCCESS(f'✅ Found {len(model_classes)} model(s):'))
-        for model_name in model_classes.keys():
+        self.stdout.write(self.style.SUCCESS(f'✅ Found {len(model_names)} model(s):'))
+        for model_name in model_names:
             self.stdout.write(f'   - {model_name}')
 
         # Get app directory
@@ -71,24 +90,28 @@ class Command(BaseCommand):
         else:
             app_dir = models_path.parent
 
+        # Small apps default to one flat module per layer; per-model
+        # packages only pay off once the file count gets unwieldy
+        single_file = options['single_file']
+        if single_file is None:
+            single_file = len(model_names) <= 8
+
         # Create necessary directories
-        self.create_directories(app_dir)
+        if not single_file:
+            _crud_gen.create_directories(app_dir)
+
+        # Generate files (the generators are independent and I/O-bound,
+        # so they run on a thread pool)
+        _crud_gen.run_generators(self.stdout, self.style, app_dir, app_name, model_names, overwrite, single_file)
 
-        # Generate files
-        self.generate_serializers(app_dir, app_name, model_classes, overwrite)
-        self.generate_viewsets(app_dir, app_name, model_classes, overwrite)
-        self.generate_services(app_dir, app_name, model_classes, overwrite)
-        self.generate_urls(app_dir, app_name, model_classes, overwrite)
-        self.generate_admin(app_dir, app_name, model_classes, overwrite)
-        
         # Create apps.py if it doesn't exist
-        self.create_apps_config(app_dir, app_name, overwrite)
-        
+        _crud_gen.create_apps_config(self.stdout, self.style, app_dir, app_name, overwrite)
+
         # Automatically add to INSTALLED_APPS
-        self.add_to_installed_apps(app_name)
-        
+        _crud_gen.add_to_installed_apps(self.stdout, self.style, app_name)
+
         # Automatically add to main urls.py
-        self.add_to_main_urls(app_name)
+        _crud_gen.add_to_main_urls(self.stdout, self.style, app_name)
 
         self.stdout.write(self.style.SUCCESS('\n✨ CRUD generation completed successfully!'))
         self.stdout.write(self.style.SUCCESS('✅ App added to INSTALLED_APPS'))
@@ -97,412 +120,3 @@ class Command(BaseCommand):
         self.stdout.write(f'   1. Run migrations: python manage.py makemigrations {app_name}')
         self.stdout.write(f'   2. Run migrate: python manage.py migrate')
         self.stdout.write(f'   3. Your API is ready at: http://localhost:8000/api/{app_name}/\n')
-
-    def extract_models(self, models_file):
-        """Extract all Django model classes from a Python file using AST parsing."""
-        import ast
-        
-        model_classes = {}
-        
-        try:
-            with open(models_file, 'r') as f:
-                tree = ast.parse(f.read(), filename=models_file)
-        except Exception as e:
-            raise CommandError(f"Error parsing models file: {e}")
-        
-        # Find all class definitions
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                # Check if class inherits from models.Model
-                for base in node.bases:
-                    base_name = None
-                    if isinstance(base, ast.Attribute):
-                        if isinstance(base.value, ast.Name) and base.value.id == 'models' and base.attr == 'Model':
-                            base_name = 'Model'
-                    elif isinstance(base, ast.Name):
-                        if base.id == 'Model':
-                            base_name = 'Model'
-                    
-                    if base_name:
-                        model_classes[node.name] = node
-                        break
-
-        return model_classes
-
-    def create_directories(self, app_dir):
-        """Create necessary directories for the app structure."""
-        directories = ['serializers', 'views', 'services']
-        for dir_name in directories:
-            dir_path = app_dir / dir_name
-            dir_path.mkdir(exist_ok=True)
-            init_file = dir_path / '__init__.py'
-            if not init_file.exists():
-                init_file.touch()
-
-    def generate_serializers(self, app_dir, app_name, model_classes, overwrite):
-        """Generate individual serializer files for each model."""
-        serializers_dir = app_dir / 'serializers'
-        
-        for model_name in model_classes.keys():
-            serializer_file = serializers_dir / f'{model_name.lower()}_serializer.py'
-            
-            if serializer_file.exists() and not overwrite:
-                self.stdout.write(self.style.WARNING(f'⚠️  Skipping {serializer_file.name}'))
-                continue
-
-            content = f'''"""Serializer for {model_name} model."""
-
-from rest_framework import serializers
-from apps.{app_name}.models import {model_name}
-
-
-class {model_name}Serializer(serializers.ModelSerializer):
-    """Serializer for {model_name} model with full CRUD support."""
-    
-    class Meta:
-        model = {model_name}
-        fields = '__all__'
-        read_only_fields = ['id', 'created_at', 'updated_at']
-'''
-            serializer_file.write_text(content)
-            self.stdout.write(self.style.SUCCESS(f'✅ Generated: serializers/{serializer_file.name}'))
-
-        # Update __init__.py
-        init_file = serializers_dir / '__init__.py'
-        init_content = '"""Auto-generated serializers."""\n\n'
-        for model_name in model_classes.keys():
-            init_content += f'from .{model_name.lower()}_serializer import {model_name}Serializer\n'
-        init_content += '\n__all__ = [\n'
-        for model_name in model_classes.keys():
-            init_content += f"    '{model_name}Serializer',\n"
-        init_content += ']\n'
-        init_file.write_text(init_content)
-
-    def generate_viewsets(self, app_dir, app_name, model_classes, overwrite):
-        """Generate individual viewset files for each model."""
-        views_dir = app_dir / 'views'
-
-        for model_name in model_classes.keys():
-            viewset_file = views_dir / f'{model_name.lower()}_viewset.py'
-            
-            if viewset_file.exists() and not overwrite:
-                self.stdout.write(self.style.WARNING(f'⚠️  Skipping {viewset_file.name}'))
-                continue
-
-            content = f'''"""ViewSet for {model_name} model."""
-
-from rest_framework import viewsets, filters
-from rest_framework.permissions import IsAuthenticated
-from django_filters.rest_framework import DjangoFilterBackend
-
-from apps.{app_name}.models import {model_name}
-from apps.{app_name}.serializers import {model_name}Serializer
-from apps.{app_name}.services.{model_name.lower()}_service import {model_name}Service
-from base.throttles import DynamicThrottleMixin
-
-
-class {model_name}ViewSet(DynamicThrottleMixin, viewsets.ModelViewSet):
-    """
-    ViewSet for {model_name} with full CRUD operations.
-
-    Rate Limiting:
-    - Read operations (GET): 100/minute
-    - Write operations (POST/PUT/PATCH): 50/minute
-    - Create operations (POST): 30/minute
-    - Delete operations (DELETE): 20/minute
-    - Burst protection: 10/second
-    - Daily limit: 1000/day
-
-    Endpoints:
-    - GET    /api/{app_name}/{model_name.lower()}s/     - List all
-    - POST   /api/{app_name}/{model_name.lower()}s/     - Create new
-    - GET    /api/{app_name}/{model_name.lower()}s/{{id}}/ - Retrieve one
-    - PUT    /api/{app_name}/{model_name.lower()}s/{{id}}/ - Update (full)
-    - PATCH  /api/{app_name}/{model_name.lower()}s/{{id}}/ - Update (partial)
-    - DELETE /api/{app_name}/{model_name.lower()}s/{{id}}/ - Delete
-    """
-    queryset = {model_name}.objects.all()
-    serializer_class = {model_name}Serializer
-    permission_classes = [IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-
-    # Rate limiting is automatically applied via DynamicThrottleMixin
-    # To customize, override get_throttles() or set throttle_classes directly
-
-    # Uncomment and customize as needed:
-    # filterset_fields = ['field1', 'field2']
-    # search_fields = ['field1', 'field2']
-    # ordering_fields = ['created_at', 'updated_at']
-    # ordering = ['-created_at']
-
-    def get_queryset(self):
-        """Override to add custom filtering."""
-        return {model_name}Service.get_all()
-
-    def perform_create(self, serializer):
-        """Use service layer for creation."""
-        {model_name}Service.create(serializer.validated_data)
-
-    def perform_update(self, serializer):
-        """Use service layer for updates."""
-        {model_name}Service.update(serializer.instance, serializer.validated_data)
-
-    def perform_destroy(self, instance):
-        """Use service layer for deletion."""
-        {model_name}Service.delete(instance)
-'''
-            viewset_file.write_text(content)
-            self.stdout.write(self.style.SUCCESS(f'✅ Generated: views/{viewset_file.name}'))
-
-        # Update __init__.py
-        init_file = views_dir / '__init__.py'
-        init_content = '"""Auto-generated viewsets."""\n\n'
-        for model_name in model_classes.keys():
-            init_content += f'from .{model_name.lower()}_viewset import {model_name}ViewSet\n'
-        init_content += '\n__all__ = [\n'
-        for model_name in model_classes.keys():
-            init_content += f"    '{model_name}ViewSet',\n"
-        init_content += ']\n'
-        init_file.write_text(init_content)
-
-    def generate_services(self, app_dir, app_name, model_classes, overwrite):
-        """Generate individual service files for each model."""
-        services_dir = app_dir / 'services'
-
-        for model_name in model_classes.keys():
-            service_file = services_dir / f'{model_name.lower()}_service.py'
-            
-            if service_file.exists() and not overwrite:
-                self.stdout.write(self.style.WARNING(f'⚠️  Skipping {service_file.name}'))
-                continue
-
-            content = f'''"""Service layer for {model_name} model."""
-
-from django.db import transaction
-from apps.{app_name}.models import {model_name}
-
-
-class {model_name}Service:
-    """Business logic for {model_name}."""
-    
-    @staticmethod
-    def get_all():
-        """Get all {model_name} instances."""
-        return {model_name}.objects.all()
-    
-    @staticmethod
-    def get_by_id(id):
-        """Get {model_name} by ID."""
-        return {model_name}.objects.filter(id=id).first()
-    
-    @staticmethod
-    @transaction.atomic
-    def create(data):
-        """Create a new {model_name}."""
-        return {model_name}.objects.create(**data)
-    
-    @staticmethod
-    @transaction.atomic
-    def update(instance, data):
-        """Update an existing {model_name}."""
-        for key, value in data.items():
-            setattr(instance, key, value)
-        instance.save()
-        return instance
-    
-    @staticmethod
-    @transaction.atomic
-    def delete(instance):
-        """Delete a {model_name}."""
-        instance.delete()
-'''
-            service_file.write_text(content)
-            self.stdout.write(self.style.SUCCESS(f'✅ Generated: services/{service_file.name}'))
-
-        # Update __init__.py
-        init_file = services_dir / '__init__.py'
-        init_content = '"""Auto-generated services."""\n\n'
-        for model_name in model_classes.keys():
-            init_content += f'from .{model_name.lower()}_service import {model_name}Service\n'
-        init_content += '\n__all__ = [\n'
-        for model_name in model_classes.keys():
-            init_content += f"    '{model_name}Service',\n"
-        init_content += ']\n'
-        init_file.write_text(init_content)
-
-    def generate_urls(self, app_dir, app_name, model_classes, overwrite):
-        """Generate URL routes for all viewsets."""
-        urls_file = app_dir / 'urls.py'
-
-        if urls_file.exists() and not overwrite:
-            self.stdout.write(self.style.WARNING(f'⚠️  Skipping urls.py'))
-            return
-
-        content = f'''"""URL routes for {app_name} app."""
-
-from django.urls import path, include
-from rest_framework.routers import DefaultRouter
-from apps.{app_name}.views import (
-'''
-        for model_name in model_classes.keys():
-            content += f'    {model_name}ViewSet,\n'
-        
-        content += ''')\n
-router = DefaultRouter()
-'''
-        for model_name in model_classes.keys():
-            url_name = f"{model_name.lower()}s"
-            content += f"router.register(r'{url_name}', {model_name}ViewSet, basename='{model_name.lower()}')\n"
-
-        content += f'''
-app_name = '{app_name}'
-
-urlpatterns = [
-    path('', include(router.urls)),
-]
-'''
-        urls_file.write_text(content)
-        self.stdout.write(self.style.SUCCESS(f'✅ Generated: urls.py'))
-
-    def generate_admin(self, app_dir, app_name, model_classes, overwrite):
-        """Generate admin.py with Unfold admin interface."""
-        admin_file = app_dir / 'admin.py'
-
-        if admin_file.exists() and not overwrite:
-            self.stdout.write(self.style.WARNING(f'⚠️  Skipping admin.py'))
-            return
-
-        content = f'''"""Admin configuration for {app_name} app with Unfold interface."""
-
-from django.contrib import admin
-from unfold.admin import ModelAdmin
-from apps.{app_name}.models import (
-'''
-        for model_name in model_classes.keys():
-            content += f'    {model_name},\n'
-        
-        content += ')\n\n'
-
-        # Generate admin class for each model
-        for model_name in model_classes.keys():
-            content += f'''
-@admin.register({model_name})
-class {model_name}Admin(ModelAdmin):
-    """Admin interface for {model_name} model."""
-    
-    # Customize these fields based on your model
-    list_display = ['id', 'created_at']  # Add your model fields here
-    list_filter = ['created_at']
-    search_fields = ['id']  # Add searchable fields here
-    ordering = ['-created_at']
-    
-    # Unfold-specific configurations
-    # list_display_links = ['id']
-    # list_per_page = 25
-    # date_hierarchy = 'created_at'
-    
-    # Customize fieldsets for better organization
-    # fieldsets = (
-    #     ('Basic Information', {{
-    #         'fields': ('field1', 'field2')
-    #     }}),
-    #     ('Timestamps', {{
-    #         'fields': ('created_at', 'updated_at'),
-    #         'classes': ('collapse',)
-    #     }}),
-    # )
-    
-    # Read-only fields
-    # readonly_fields = ['created_at', 'updated_at']
-
-'''
-
-        admin_file.write_text(content)
-        self.stdout.write(self.style.SUCCESS(f'✅ Generated: admin.py'))
-
-    def create_apps_config(self, app_dir, app_name, overwrite):
-        """Create apps.py configuration file."""
-        apps_file = app_dir / 'apps.py'
-        
-        if apps_file.exists() and not overwrite:
-            return
-
-        content = f'''from django.apps import AppConfig
-
-
-class {app_name.capitalize()}Config(AppConfig):
-    default_auto_field = 'django.db.models.BigAutoField'
-    name = 'apps.{app_name}'
-    label = '{app_name}'
-'''
-        apps_file.write_text(content)
-        self.stdout.write(self.style.SUCCESS(f'✅ Generated: apps.py'))
-
-    def add_to_installed_apps(self, app_name):
-        """Automatically add app to INSTALLED_APPS in settings."""
-        settings_file = Path('base/core/base.py')
-        
-        if not settings_file.exists():
-            self.stdout.write(self.style.WARNING('⚠️  Could not find base/core/base.py'))
-            return
-
-        content = settings_file.read_text()
-        app_entry = f"'apps.{app_name}'"
-        
-        # Check if already added
-        if app_entry in content:
-            self.stdout.write(self.style.WARNING(f'⚠️  App already in INSTALLED_APPS'))
-            return
-
-        # Find LOCAL_APPS and add the app
-        pattern = r"(LOCAL_APPS\s*=\s*\[)([^\]]*)(])"
-        
-        def add_app(match):
-            start = match.group(1)
-            apps = match.group(2)
-            end = match.group(3)
-            
-            # Add the new app
-            if apps.strip():
-                return f"{start}{apps}\n    {app_entry},\n{end}"
-            else:
-                return f"{start}\n    {app_entry},\n{end}"
-        
-        new_content = re.sub(pattern, add_app, content, flags=re.DOTALL)
-        settings_file.write_text(new_content)
-
-    def add_to_main_urls(self, app_name):
-        """Automatically add app URLs to main urls.py."""
-        urls_file = Path('base/urls.py')
-        
-        if not urls_file.exists():
-            self.stdout.write(self.style.WARNING('⚠️  Could not find base/urls.py'))
-            return
-
-        content = urls_file.read_text()
-        url_pattern = f"path('api/{app_name}/', include('apps.{app_name}.urls'))"
-        
-        # Check if already added
-        if f"api/{app_name}/" in content:
-            self.stdout.write(self.style.WARNING(f'⚠️  URLs already added'))
-            return
-
-        # Ensure 'include' is imported
-        if 'from django.urls import' in content and 'include' not in content:
-            content = content.replace(
-                'from django.urls import path',
-                'from django.urls import path, include'
-            )
-
-        # Find urlpatterns and add the new path
-        pattern = r"(urlpatterns\s*=\s*\[)([^\]]*)(])"
-        
-        def add_url(match):
-            start = match.group(1)
-            patterns = match.group(2)
-            end = match.group(3)
-            
-            return f"{start}{patterns}\n    {url_pattern},\n{end}"
-        
-        new_content = re.sub(pattern, add_url, content, flags=re.DOTALL)
-        urls_file.write_text(new_content)
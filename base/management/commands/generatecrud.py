@@ -7,7 +7,6 @@ Usage:
 This will scan the app's models.py and generate CRUD APIs for all models.
 """
 
-import ast
 from pathlib import Path
 from django.core.management.base import BaseCommand, CommandError
 
@@ -26,8 +25,26 @@ class Command(BaseCommand):
             action='store_true',
             help='Overwrite existing files'
         )
+        parser.add_argument(
+            '--single-file',
+            action='store_true',
+            dest='single_file',
+            default=None,
+            help='Emit one serializers.py/views.py/services.py instead of '
+                 'per-model packages (default for 8 models or fewer)'
+        )
+        parser.add_argument(
+            '--multi-file',
+            action='store_false',
+            dest='single_file',
+            help='Force one file per model even for small apps'
+        )
 
     def handle(self, *args, **options):
+        # Deferred so command discovery doesn't import the generators
+        from base.management.commands import _crud_gen
+        from base.management.commands._ast_cache import extract_models
+
         app_name = options['app_name']
         overwrite = options['overwrite']
         
@@ -44,37 +61,32 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS(f'\n🚀 Generating CRUD for app: {app_name}'))
         
         # Extract models
-        model_classes = self.extract_models(models_file)
+        model_names = extract_models(models_file)
         
-        if not model_classes:
+        if not model_names:
             raise CommandError(f'No Django models found in apps/{app_name}/models.py')
         
-        self.stdout.write(self.style.SUCCESS(f'✅ Found {len(model_classes)} model(s):'))
-        for model_name in model_classes.keys():
+        self.stdout.write(self.style.SUCCESS(f'✅ Found {len(model_names)} model(s):'))
+        for model_name in model_names:
             self.stdout.write(f'   - {model_name}')
         
-        # Import generation functions
-        from base.management.commands.createcrud import Command as CrudCommand
-        
-        crud_cmd = CrudCommand()
-        crud_cmd.stdout = self.stdout
-        crud_cmd.style = self.style
-        
+        # Small apps default to one flat module per layer
+        single_file = options['single_file']
+        if single_file is None:
+            single_file = len(model_names) <= 8
+
         # Create directories
-        crud_cmd.create_directories(app_dir)
-        
-        # Generate files
-        crud_cmd.generate_serializers(app_dir, app_name, model_classes, overwrite)
-        crud_cmd.generate_viewsets(app_dir, app_name, model_classes, overwrite)
-        crud_cmd.generate_services(app_dir, app_name, model_classes, overwrite)
-        crud_cmd.generate_urls(app_dir, app_name, model_classes, overwrite)
-        crud_cmd.generate_admin(app_dir, app_name, model_classes, overwrite)
-        
+        if not single_file:
+            _crud_gen.create_directories(app_dir)
+
+        # Generate files concurrently; the generators touch disjoint paths
+        _crud_gen.run_generators(self.stdout, self.style, app_dir, app_name, model_names, overwrite, single_file)
+
         # Add to INSTALLED_APPS if not already
-        crud_cmd.add_to_installed_apps(app_name)
-        
+        _crud_gen.add_to_installed_apps(self.stdout, self.style, app_name)
+
         # Add to main urls.py if not already
-        crud_cmd.add_to_main_urls(app_name)
+        _crud_gen.add_to_main_urls(self.stdout, self.style, app_name)
         
         self.stdout.write(self.style.SUCCESS('\n✨ CRUD generation completed!'))
         self.stdout.write(self.style.SUCCESS('✅ App configured in INSTALLED_APPS'))
@@ -83,32 +95,3 @@ class Command(BaseCommand):
         self.stdout.write(f'   1. Run migrations: python manage.py makemigrations {app_name}')
         self.stdout.write(f'   2. Run migrate: python manage.py migrate')
         self.stdout.write(f'   3. Your API is ready at: http://localhost:8000/api/{app_name}/\n')
-
-    def extract_models(self, models_file):
-        """Extract all Django model classes from models.py using AST parsing."""
-        model_classes = {}
-        
-        try:
-            with open(models_file, 'r') as f:
-                tree = ast.parse(f.read(), filename=str(models_file))
-        except Exception as e:
-            raise CommandError(f"Error parsing models file: {e}")
-        
-        # Find all class definitions
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                # Check if class inherits from models.Model
-                for base in node.bases:
-                    base_name = None
-                    if isinstance(base, ast.Attribute):
-                        if isinstance(base.value, ast.Name) and base.value.id == 'models' and base.attr == 'Model':
-                            base_name = 'Model'
-                    elif isinstance(base, ast.Name):
-                        if base.id == 'Model':
-                            base_name = 'Model'
-                    
-                    if base_name:
-                        model_classes[node.name] = node
-                        break
-
-        return model_classes
@@ -12,15 +12,35 @@ import hashlib
 class CRUDBaseThrottle:
     """Base throttle class with common utilities."""
 
+    def __init__(self):
+        # SimpleRateThrottle.__init__ resolves and parses the rate string
+        # on every instantiation, and throttles are instantiated per
+        # request. Every throttle here pins ``rate`` on the class, so
+        # parse it once and memoize the result on the class. The
+        # instances themselves can't be shared: allow_request() stores
+        # per-request state (self.key/self.history) on self.
+        cls = type(self)
+        parsed = cls.__dict__.get('_parsed_rate')
+        if parsed is None:
+            parsed = cls._parsed_rate = self.parse_rate(self.rate)
+        self.num_requests, self.duration = parsed
+
     def get_cache_key(self, request, view):
         """Generate cache key based on user or IP."""
-        if request.user and request.user.is_authenticated:
-            ident = str(request.user.id)
-        else:
-            ident = self.get_ident(request)
+        # Stacked throttles each call get_cache_key for the same request,
+        # so hash the ident once and stash it on the request
+        hashed = getattr(request, '_crud_ident_hash', None)
+        if hashed is None:
+            if request.user and request.user.is_authenticated:
+                ident = str(request.user.id)
+            else:
+                ident = self.get_ident(request)
+
+            # Hash for privacy; blake2b is faster than sha256 on short
+            # idents and this is a fingerprint, not a security boundary
+            hashed = hashlib.blake2b(ident.encode(), digest_size=8).hexdigest()
+            request._crud_ident_hash = hashed
 
-        # Hash for privacy
-        hashed = hashlib.sha256(ident.encode()).hexdigest()[:16]
         return self.cache_format % {
             'scope': self.scope,
             'ident': hashed
@@ -85,6 +105,23 @@ class PublicCRUDThrottles:
     throttle_classes = [CRUDAnonThrottle, BurstRateThrottle, CRUDReadThrottle]
 
 
+# Action -> throttle classes, resolved with one dict lookup per request
+# instead of rebuilding lists and scanning them in get_throttles()
+_READ_THROTTLES = (BurstRateThrottle, CRUDReadThrottle, SustainedRateThrottle)
+_WRITE_THROTTLES = (BurstRateThrottle, CRUDWriteThrottle, SustainedRateThrottle)
+_CREATE_THROTTLES = (BurstRateThrottle, CRUDCreateThrottle, SustainedRateThrottle)
+_DELETE_THROTTLES = (BurstRateThrottle, CRUDDeleteThrottle, SustainedRateThrottle)
+
+_ACTION_THROTTLES = {
+    'list': _READ_THROTTLES,
+    'retrieve': _READ_THROTTLES,
+    'create': _CREATE_THROTTLES,
+    'update': _WRITE_THROTTLES,
+    'partial_update': _WRITE_THROTTLES,
+    'destroy': _DELETE_THROTTLES,
+}
+
+
 def get_throttles_for_action(action: str):
     """
     Get appropriate throttle classes based on the action.
@@ -93,23 +130,9 @@ def get_throttles_for_action(action: str):
         action: ViewSet action ('list', 'retrieve', 'create', 'update', 'partial_update', 'destroy')
 
     Returns:
-        list: Throttle classes for the action
+        tuple: Throttle classes for the action (write throttles for unknown actions)
     """
-    read_actions = ['list', 'retrieve']
-    write_actions = ['update', 'partial_update']
-    create_actions = ['create']
-    delete_actions = ['destroy']
-
-    if action in read_actions:
-        return [BurstRateThrottle, CRUDReadThrottle, SustainedRateThrottle]
-    elif action in create_actions:
-        return [BurstRateThrottle, CRUDCreateThrottle, SustainedRateThrottle]
-    elif action in delete_actions:
-        return [BurstRateThrottle, CRUDDeleteThrottle, SustainedRateThrottle]
-    elif action in write_actions:
-        return [BurstRateThrottle, CRUDWriteThrottle, SustainedRateThrottle]
-    else:
-        return [BurstRateThrottle, CRUDWriteThrottle, SustainedRateThrottle]
+    return _ACTION_THROTTLES.get(action, _WRITE_THROTTLES)
 
 
 class DynamicThrottleMixin:
@@ -123,6 +146,7 @@ class DynamicThrottleMixin:
 
     def get_throttles(self):
         """Override to get action-specific throttles."""
-        action = self.action
-        throttle_classes = get_throttles_for_action(action)
-        return [throttle() for throttle in throttle_classes]
+        # Fresh instances per request: DRF throttles stash request state
+        # (self.history/self.key) during allow_request, so pre-instantiated
+        # shared instances would race across threads
+        return [throttle() for throttle in get_throttles_for_action(self.action)]
@@ -10,13 +10,11 @@ https://docs.djangoproject.com/en/6.0/howto/deployment/wsgi/
 import os
 from pathlib import Path
 
-# Load .env file before Django settings
-try:
-    from dotenv import load_dotenv
-    env_path = Path(__file__).resolve().parent.parent / '.env'
-    load_dotenv(dotenv_path=env_path)
-except ImportError:
-    pass
+# Load .env file before Django settings (mtime-cached so worker
+# cold-starts skip re-parsing an unchanged file)
+from base._dotenv_cache import load_env
+
+load_env(Path(__file__).resolve().parent.parent / '.env')
 
 from django.core.wsgi import get_wsgi_application
 